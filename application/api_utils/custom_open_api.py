@@ -41,9 +41,12 @@ class CustomOpenAPI:
     -------
         routes_to_modify (List[str]):
             Routes which need their OpenAPI schemas to be modified.
+        routes_without_api_key (List[str]):
+            Routes which are available without the 'api-key' header.
     """
 
     routes_to_modify: List[str] = ["/api/tweets", "/api/users/me"]
+    routes_without_api_key: List[str] = ["/api/users/new"]
 
     @classmethod
     def add_route_for_modification(cls, route: str) -> None:
@@ -112,6 +115,8 @@ class CustomOpenAPI:
         Specifically, it removes the optional 'testing' parameter from the
         method, it also removes the specified response status code from the
         'GET' methods' responses for paths listed in 'cls.routes_to_modify'.
+        Finally, the 'api-key' header is described with the help of the
+        'add_api_key_security' class method.
 
         Args:
             open_api_schema (Dict[str, Any]):
@@ -130,6 +135,47 @@ class CustomOpenAPI:
                 status_code_for_deletion=status_code_for_deletion,
             )
 
+        return cls.add_api_key_security(open_api_schema=open_api_schema)
+
+    @classmethod
+    def add_api_key_security(
+        cls,
+        open_api_schema: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Describe the 'api-key' header in the OpenAPI schema.
+
+        The header is checked by the middleware rather than by a route
+        dependency, so FastAPI doesn't add it to the schema. The security
+        scheme is added to the components and required by every path
+        except the ones listed in 'cls.routes_without_api_key'.
+
+        Args:
+            open_api_schema (Dict[str, Any]):
+                The OpenAPI schema to modify.
+
+        Returns:
+            Dict[str, Any]: The OpenAPI schema with the security scheme.
+        """
+        from application.main import api_key_header
+
+        security_schemes: Dict[str, Any] = open_api_schema.setdefault(
+            "components",
+            {},
+        ).setdefault("securitySchemes", {})
+        security_schemes[api_key_header.scheme_name] = (
+            api_key_header.model.model_dump(
+                mode="json",
+                by_alias=True,
+                exclude_none=True,
+            )
+        )
+        for path, path_dict in open_api_schema["paths"].items():
+            if path in cls.routes_without_api_key:
+                continue
+            for method_dict in path_dict.values():
+                method_dict["security"] = [{api_key_header.scheme_name: []}]
+
         return open_api_schema
 
     @classmethod
@@ -0,0 +1,47 @@
+"""
+This module provides a function to generate basic success responses.
+
+The body of the basic success response never changes, so it is serialized
+only once, when the module is imported. The function
+`generate_success_response` wraps the prepared body into a new response
+with the requested status code, so the routes which only report a success
+don't pass through pydantic serialization at all.
+
+Modules:
+--------
+fastapi.responses : For building the raw HTTP response.
+application.schemas.basic_schemas: Includes basic response schemas
+for the API.
+
+Functions:
+----------
+generate_success_response(status_code: int) -> Response:
+    Produce a Response with the prepared basic success body.
+"""
+
+from fastapi.responses import Response
+
+from application.schemas.basic_schemas import BasicSuccessResponse
+
+BASIC_SUCCESS_BODY: bytes = BasicSuccessResponse().model_dump_json().encode()
+
+
+def generate_success_response(status_code: int) -> Response:
+    """
+    Generate a response indicating a success.
+
+    A new response is created for every call, because the middlewares
+    may modify its headers, but the body is shared between them.
+
+    Args:
+        status_code (int): HTTP status code for the response.
+
+    Returns:
+        Response: A FastAPI response object with status_code and
+            a JSON content indicating the successful result.
+    """
+    return Response(
+        content=BASIC_SUCCESS_BODY,
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -0,0 +1,49 @@
+"""
+This module provides a response class that serializes pydantic models.
+
+By default FastAPI converts a returned model to builtin python objects
+with `jsonable_encoder` and only then dumps them with the standard `json`
+module. The `PydanticResponse` skips both steps and lets pydantic-core
+serialize the model straight to JSON.
+
+Modules:
+--------
+fastapi.responses : For building the raw HTTP response.
+pydantic: A data validation and settings management library using
+python type annotations.
+
+Classes:
+--------
+PydanticResponse:
+    A response that renders a pydantic model with its pydantic-core
+    serializer.
+"""
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class PydanticResponse(Response):
+    """
+    Implement PydanticResponse Class.
+
+    The response is used for returning success schemas from the routes.
+    The status code must be passed explicitly, because FastAPI does not
+    apply the route's `status_code` to responses returned directly.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:  # noqa: WPS110
+        """
+        Render the pydantic model into the response body.
+
+        The JSON is written by the pydantic-core serializer of the model.
+
+        Args:
+            content (BaseModel): The model to be sent to the client.
+
+        Returns:
+            bytes: The JSON representation of the model.
+        """
+        return content.model_dump_json().encode()
@@ -0,0 +1,85 @@
+"""
+Module provides an in-process cache for the users' profile responses.
+
+The profiles are requested much more often than they change, so the
+prepared responses are kept in a TTL cache keyed by the user ID.
+The cache is cleared each time a subscription of any user is changed.
+
+Modules:
+--------
+typing: Supports type hints.
+cachetools: Provides memoizing collections such as TTLCache.
+application.logger.logger_instance: Instance of application logger
+application.schemas.user_schemas: Schemas related to user data
+
+Functions:
+----------
+take_cached_user_response(user_id: int) -> Optional[UserResponse]:
+    Get the cached profile of the user.
+
+cache_user_response(
+    user_id: int, user_response: Optional[UserResponse],
+) -> None:
+    Save the found profile of the user into the cache.
+
+invalidate_user_responses() -> None:
+    Remove all the cached profiles.
+"""
+
+from typing import Optional
+
+from cachetools import TTLCache
+
+from application.logger.logger_instance import app_logger
+from application.schemas.user_schemas import UserResponse
+
+CACHE_MAX_SIZE: int = 10000
+CACHE_TTL: int = 30
+
+user_responses_cache: TTLCache = TTLCache(
+    maxsize=CACHE_MAX_SIZE,
+    ttl=CACHE_TTL,
+)
+
+
+def take_cached_user_response(user_id: int) -> Optional[UserResponse]:
+    """
+    Get the cached profile of the user.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        Optional[UserResponse]: The cached profile or None if it is
+            absent or expired.
+    """
+    return user_responses_cache.get(user_id)
+
+
+def cache_user_response(
+    user_id: int,
+    user_response: Optional[UserResponse],
+) -> None:
+    """
+    Save the profile of the user into the cache.
+
+    A missing profile is never cached, so the next request looks for
+    the user in the database again.
+
+    Args:
+        user_id (int): The ID of the user.
+        user_response (Optional[UserResponse]): The profile of the user.
+    """
+    if user_response is not None:
+        user_responses_cache[user_id] = user_response
+
+
+def invalidate_user_responses() -> None:
+    """
+    Remove all the cached profiles.
+
+    A subscription changes the profiles of both users, so the whole
+    cache is dropped instead of tracking the affected entries.
+    """
+    app_logger.info("Clearing cached user profiles")
+    user_responses_cache.clear()
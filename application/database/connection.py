@@ -10,7 +10,8 @@ These sessions are committed after successful execution of tasks,
 and rolled back in the case of any exceptions.
 
 A dotenv mechanism is provided to load environment variables
-(DB_USER, DB_PASSWORD)
+(DB_USER, DB_PASSWORD, DB_ECHO). The SQL statements are logged only
+if DB_ECHO is set to "true".
 
 Modules:
 --------
@@ -52,9 +53,10 @@ DB_URL: str = "postgresql+asyncpg://{0}:{1}@db:5432/twitter_clone_db".format(
     DB_PASSWORD,
 )
 TESTING_DB_URL: str = "sqlite+aiosqlite:///:memory:"
+DB_ECHO: bool = os.getenv("DB_ECHO") == "true"
 engine: AsyncEngine = create_async_engine(
     DB_URL,
-    echo=True,
+    echo=DB_ECHO,
     poolclass=NullPool,
 )
 test_engine: AsyncEngine = create_async_engine(
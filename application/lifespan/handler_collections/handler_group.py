@@ -16,6 +16,8 @@ declutters data class definitions.
 handlers).
 `application.lifespan.handlers.model_handlers`: Specifically, `ModelLoader`.
 A handler class for loading models.
+`application.lifespan.handlers.openapi_handlers`: Specifically,
+`OpenAPILoader`. A handler class for building the OpenAPI schema.
 
 Classes:
 --------
@@ -30,6 +32,7 @@ from application.lifespan.handlers.abstract_handlers import (
     ApplicationEventHandler,
 )
 from application.lifespan.handlers.model_handlers import ModelLoader
+from application.lifespan.handlers.openapi_handlers import OpenAPILoader
 
 
 @dataclass
@@ -75,3 +78,4 @@ class EventHandler:
 
 current_event_handler = EventHandler()
 current_event_handler.add_handler(ModelLoader())
+current_event_handler.add_handler(OpenAPILoader())
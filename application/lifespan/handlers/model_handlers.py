@@ -3,13 +3,15 @@ This module manages the loading of application models.
 
 The `ModelLoader` class, a subclass of `ApplicationEventHandler`,
 is responsible for the loading of application models.
-During the startup of the application, it connects to the database
-engine and loads the model's metadata.
+During the startup of the application, it configures the mappers of
+the models, connects to the database engine and loads the model's
+metadata.
 At the shutdown of the application, it logs the shutdown process
 and disposes the connection to the engine.
 
 Modules:
 --------
+sqlalchemy.orm: Provides configuration of the ORM mappers.
 application.database.connection: Connects to the database.
 application.lifespan.handlers.abstract_handlers.ApplicationEventHandler:
 Framework for building application event handlers.
@@ -26,6 +28,8 @@ ModelLoader:
     A handler for loading of application models.
 """
 
+from sqlalchemy.orm import configure_mappers
+
 from application.database.connection import engine
 from application.lifespan.handlers.abstract_handlers import (
     ApplicationEventHandler,
@@ -50,8 +54,9 @@ class ModelLoader(ApplicationEventHandler):
     Methods:
     ----------
     startup() -> None: Calls at the startup event.
-                        Connects to the engine and
-                        loads the metadata of models.
+                        Configures the mappers, connects
+                        to the engine and loads the
+                        metadata of models.
 
     shutdown() -> None: Calls at the shutdown event.
                         Logs the shutdown process
@@ -61,9 +66,12 @@ class ModelLoader(ApplicationEventHandler):
     async def startup(self) -> None:
         """Carries out initialization tasks.
 
+        Configures the mappers, so the relationships of the models are
+        resolved before the first request rather than during it.
         Connects to engine and loads the metadata,
         logging the start of the process.
         """
+        configure_mappers()
         async with engine.begin() as connection:
             app_logger.info("Model Loader Started")
             await connection.run_sync(Base.metadata.create_all)
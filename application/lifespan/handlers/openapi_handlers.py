@@ -0,0 +1,62 @@
+"""
+This module manages the building of the OpenAPI schema.
+
+The `OpenAPILoader` class, a subclass of `ApplicationEventHandler`,
+builds the OpenAPI schema of the application during its startup,
+so the first request to the documentation doesn't wait for it.
+
+Modules:
+--------
+application.lifespan.handlers.abstract_handlers.ApplicationEventHandler:
+Framework for building application event handlers.
+application.logger.logger_instance: Handles the logging within
+the application.
+
+Classes:
+--------
+OpenAPILoader:
+    A handler for building of the OpenAPI schema.
+"""
+
+from application.lifespan.handlers.abstract_handlers import (
+    ApplicationEventHandler,
+)
+from application.logger.logger_instance import app_logger
+
+
+class OpenAPILoader(ApplicationEventHandler):
+    """Handles the building of the OpenAPI schema.
+
+    Inherits methods from the ApplicationEventHandler
+    abstract base class.
+
+    Attributes:
+    -----------
+    None
+
+    Methods:
+    ----------
+    startup() -> None: Calls at the startup event.
+                        Builds and caches the OpenAPI schema.
+
+    shutdown() -> None: Calls at the shutdown event.
+                        Logs the shutdown process.
+    """
+
+    async def startup(self) -> None:
+        """Carries out initialization tasks.
+
+        Builds the OpenAPI schema, which the application caches
+        for the following requests.
+        """
+        from application.main import app
+
+        app_logger.info("OpenAPI Loader Started")
+        app.openapi()
+
+    async def shutdown(self) -> None:
+        """Carries out shutdown tasks.
+
+        Logs shutdown process.
+        """
+        app_logger.info("OpenAPI Loader Stopped")
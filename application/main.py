@@ -33,11 +33,11 @@ Variables:
 Context Manager with the AsyncSession for database interactions.
 
 3) `api_key_header`: Instance of APIKeyHeader.
-This is a FastAPI dependency that checks for a specific 'api-key' header
-in the requests where it's applied.
+It describes the 'api-key' header in the OpenAPI schema. The header itself
+is checked by the API key middleware, so the routes don't depend on it.
 
-Please note: The OpenAPI schema for FastAPI app is created and set when the
-/docs endpoint is hit for the first time.
+Please note: The OpenAPI schema for FastAPI app is created and set at the
+startup of the application by the `OpenAPILoader` lifespan handler.
 The OpenAPI schema is customized by overwriting the `openapi`
 method of the initial FastAPI app with the custom functionality
 defined in `CustomFastAPI` and `CustomOpenAPI` classes.
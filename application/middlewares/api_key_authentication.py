@@ -4,12 +4,16 @@ This module encompasses the middleware logic for API key authentication.
 It carries an asynchronous function 'check_api_key', which checks the
 validity of the provided API key in the header of the incoming requests.
 It matches the API key with the existing users' keys in the database to
-authenticate the requests.
+authenticate the requests. The users found are kept in a TTL cache, so
+the following requests with the same key don't touch the database.
 
 Modules:
 --------
 typing: Provides all the type hints needed in the function.
+hashlib: Secure hashes and message digests.
+cachetools: Provides memoizing collections such as TTLCache.
 fastapi: Framework used for building APIs.
+sqlalchemy: Provides helpers for the ORM instances state.
 application.api_utils.user_data_processing: Contains utilities for processing
 user data.
 application.database.connection: Handles database connection related tasks.
@@ -18,41 +22,127 @@ application.models.user: Module including the User model.
 
 Functions:
 ----------
+make_cache_key(api_key: str) -> bytes:
+    Make a compact key of the authenticated users cache.
+restore_user(user_data: cached_user) -> User:
+    Restore the detached User instance from the cached data.
+async def take_user_by_api_key(api_key: str) -> Optional[User]:
+    Get the user by the API key from the cache or the database.
+async def authenticate(path: str, api_key: Optional[str]) -> Optional[User]:
+    Authenticate the request by its path and API key.
 async def check_api_key(request: Request, call_next: Callable[[Request],
  Awaitable[Response]]) -> Response:
     Authenticates the user by checking if the provided API key matches
      with existing users' keys.
 """
 
-from typing import Awaitable, Callable, Optional
+import hashlib
+from typing import Awaitable, Callable, NewType, Optional, Tuple
 
+from cachetools import TTLCache
 from fastapi import HTTPException, Request, Response, status
+from sqlalchemy.orm import make_transient_to_detached
 
 from application.api_utils.user_data_processing import hash_api_key
 from application.database.connection import get_session
 from application.logger.logger_instance import app_logger
 from application.models.user import User
 
+AUTHENTICATED_USERS_MAX_SIZE: int = 100000
+AUTHENTICATED_USERS_TTL: int = 60
+CACHE_KEY_SIZE: int = 16
 
-async def check_api_key(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    """Check validity of user's API key.
+cached_user = NewType("cached_user", Tuple[int, str, str])
+
+authenticated_users_cache: TTLCache = TTLCache(
+    maxsize=AUTHENTICATED_USERS_MAX_SIZE,
+    ttl=AUTHENTICATED_USERS_TTL,
+)
 
-    It checks all incoming HTTP requests, except for the endpoints
-    "/api/users/new", "/docs" and "/openapi.json".
-    If the api-key is valid, the user will be got from a database and passed
-    to the endpoint
+
+def make_cache_key(api_key: str) -> bytes:
+    """
+    Make a compact key of the authenticated users cache.
 
     Args:
-        request (Request): FastAPI request object, encapsulates the incoming
-            HTTP request.
-        call_next (Callable): A callable that will be used to process the
-            request and generate the response within the middleware stack.
+        api_key (str): The API key from the request header.
 
     Returns:
-        Response: The response generated by processing the request.
+        bytes: The BLAKE2 digest of the API key.
+    """
+    return hashlib.blake2b(
+        api_key.encode("utf-8"),
+        digest_size=CACHE_KEY_SIZE,
+    ).digest()
+
+
+def restore_user(user_data: cached_user) -> User:
+    """
+    Restore the detached User instance from the cached data.
+
+    The cache keeps only the columns of the user, and each request gets
+    its own instance, so the same object is never attached to several
+    sessions at once.
+
+    Args:
+        user_data (cached_user): ID, name and hashed API key of the user.
+
+    Returns:
+        User: The User instance in the detached state.
+    """
+    user_id, name, api_key = user_data
+    user = User(id=user_id, name=name, api_key=api_key)
+    make_transient_to_detached(user)
+    return user
+
+
+async def take_user_by_api_key(api_key: str) -> Optional[User]:
+    """
+    Get the user by the API key from the cache or the database.
+
+    Only the users found are cached, so a user created after a failed
+    attempt is authenticated by the next request.
+
+    Args:
+        api_key (str): The API key from the request header.
+
+    Returns:
+        Optional[User]: The User instance if found, else None.
+    """
+    cache_key: bytes = make_cache_key(api_key=api_key)
+    user_data: Optional[cached_user] = authenticated_users_cache.get(
+        cache_key,
+    )
+    if user_data is not None:
+        app_logger.info("User with API key found in cache")
+        return restore_user(user_data=user_data)
+    encrypted_api_key: str = hash_api_key(api_key=api_key)
+    app_logger.info("Searching for existing user with API key")
+    async with get_session() as session:
+        user: Optional[User] = await User.get_user_by_api_key(
+            session=session,
+            api_key=encrypted_api_key,
+        )
+    if user is not None:
+        authenticated_users_cache[cache_key] = cached_user(
+            (int(user.id), str(user.name), str(user.api_key)),
+        )
+    return user
+
+
+async def authenticate(path: str, api_key: Optional[str]) -> Optional[User]:
+    """Authenticate the request by its path and API key.
+
+    The requests to the endpoints "/api/users/new", "/docs" and
+    "/openapi.json" don't need the API key.
+
+    Args:
+        path (str): The path of the requested endpoint.
+        api_key (Optional[str]): The API key from the request header.
+
+    Returns:
+        Optional[User]: The User instance owning the API key or None
+            if the endpoint doesn't need the API key.
 
     Raises:
         HTTPException: If `api-key` header is not included in the request
@@ -60,26 +150,18 @@ async def check_api_key(
             key in the database.
     """
     app_logger.info("Checking API Key")
-    api_key: Optional[str] = request.headers.get("api-key")
-    path: str = request.url.path
     if path == "/api/users/new" or path in {"/openapi.json", "/docs"}:
         app_logger.info(
             "API Key will not be used (adding a new user or read API doc)",
         )
-        return await call_next(request)
+        return None
     if api_key is None:
         app_logger.exception("No API key provided")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="api-key header required",
         )
-    encrypted_api_key: str = hash_api_key(api_key=api_key)
-    app_logger.info("Searching for existing user with API key")
-    async with get_session() as session:
-        user: Optional["User"] = await User.get_user_by_api_key(
-            session=session,
-            api_key=encrypted_api_key,
-        )
+    user: Optional[User] = await take_user_by_api_key(api_key=api_key)
     if user is None:
         app_logger.exception("Invalid API key")
         raise HTTPException(
@@ -87,6 +169,34 @@ async def check_api_key(
             detail="Invalid api-key header",
         )
     app_logger.info("User with API key found")
-    request.state.user = user
-    app_logger.info("API key successfully checked")
+    return user
+
+
+async def check_api_key(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """Check validity of user's API key.
+
+    It checks all incoming HTTP requests, except for the endpoints
+    "/api/users/new", "/docs" and "/openapi.json".
+    If the api-key is valid, the user will be got from a database and passed
+    to the endpoint
+
+    Args:
+        request (Request): FastAPI request object, encapsulates the incoming
+            HTTP request.
+        call_next (Callable): A callable that will be used to process the
+            request and generate the response within the middleware stack.
+
+    Returns:
+        Response: The response generated by processing the request.
+    """
+    user: Optional[User] = await authenticate(
+        path=request.url.path,
+        api_key=request.headers.get("api-key"),
+    )
+    if user is not None:
+        request.state.user = user
+        app_logger.info("API key successfully checked")
     return await call_next(request)
@@ -128,23 +128,56 @@ class ErrorHandler:
         try:
             return await call_next(request)
         except Exception as exc:
-            error_info: Optional[error_content] = cls.error_handlers.get(
-                type(exc),
-            )
-            app_logger.exception(
-                "Error handling request: {0}".format(str(exc)),
-            )
-            if error_info:
-                return generate_error_response(
-                    status_code=int(error_info[STATUS_CODE]),
-                    error_type=str(error_info[ERROR_TYPE]),
-                    error_message=str(error_info[ERROR_MESSAGE]),
-                )
+            return cls.generate_response(exc=exc)
+
+    @classmethod
+    async def handle_exception(
+        cls,
+        request: Request,
+        exc: Exception,
+    ) -> Response:
+        """Handle the exception as an exception handler of the application.
+
+        Args:
+            request (Request):
+                The HTTP request which caused the exception.
+            exc (Exception):
+                The exception raised during the handling of the request.
+
+        Returns:
+            The error response corresponding to the exception.
+        """
+        return cls.generate_response(exc=exc)
+
+    @classmethod
+    def generate_response(cls, exc: Exception) -> Response:
+        """Generate the error response for the caught exception.
+
+        Args:
+            exc (Exception):
+                The exception raised during the handling of a request.
+
+        Returns:
+            The error response described by the exception mapping or
+            the internal server error response for unknown exceptions.
+        """
+        error_info: Optional[error_content] = cls.error_handlers.get(
+            type(exc),
+        )
+        app_logger.exception(
+            "Error handling request: {0}".format(str(exc)),
+        )
+        if error_info:
             return generate_error_response(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                error_type=str(type(exc).__name__),
-                error_message="Something went wrong on the server side",
+                status_code=int(error_info[STATUS_CODE]),
+                error_type=str(error_info[ERROR_TYPE]),
+                error_message=str(error_info[ERROR_MESSAGE]),
             )
+        return generate_error_response(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            error_type=str(type(exc).__name__),
+            error_message="Something went wrong on the server side",
+        )
 
     @classmethod
     async def add_error(
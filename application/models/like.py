@@ -21,11 +21,11 @@ application.models.user: Houses methods and fields for the 'User' entity.
 
 """
 
-from typing import Optional
+from typing import Optional, Tuple
 
-from sqlalchemy import Column, Integer, select
+from sqlalchemy import Column, Integer, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import aliased, relationship
 
 from application.errors.tweet_id_validation import TweetIdValidationError
 from application.logger.logger_instance import app_logger
@@ -93,24 +93,19 @@ class Like(Base):
             TweetIdValidationError: If the tweet with the provided
                 ID does not exist, a validation error is raised.
         """
-        previously_liked: bool = await cls.has_like(
+        tweet: Optional[Tweet]
+        like: Optional["Like"]
+        tweet, like = await cls.take_tweet_with_like(
             session=session,
             tweet_id=tweet_id,
             user=user,
         )
-        if previously_liked:
-            await cls.delete_like(
-                session=session,
-                tweet_id=tweet_id,
-                user=user,
-            )
-            return
-        tweet: Optional[Tweet] = await cls.get_tweet_of_like(
-            session=session,
-            tweet_id=tweet_id,
-        )
         if not tweet:
             raise TweetIdValidationError("Tweet does not exist.")
+        if like:
+            app_logger.info("Deleting the previous like")
+            await session.delete(like)
+            return
         app_logger.info("Like adding to the tweet")
         new_like: "Like" = cls()
         new_like.tweet_association.append(tweet)
@@ -118,30 +113,48 @@ class Like(Base):
         session.add(new_like)
 
     @classmethod
-    async def get_tweet_of_like(
+    async def take_tweet_with_like(
         cls,
         session: AsyncSession,
         tweet_id: int,
-    ) -> Optional[Tweet]:
+        user: User,
+    ) -> Tuple[Optional[Tweet], Optional["Like"]]:
         """
-        Return the 'Tweet' instance associated with the provided tweet id.
+        Return the tweet and the like the user has already given it.
 
-        This tweet is also associated with the 'Like' entity
+        Both are fetched by a single query: the like of the user is
+        outer-joined to the tweet, so the like is None when the tweet
+        hasn't been liked yet.
 
         Args:
             session (AsyncSession):
                 The sqlalchemy session.
             tweet_id (int):
                 The ID of the tweet.
+            user (User):
+                The User instance liking the tweet.
 
         Returns:
-            Optional[Tweet]: An instance of 'Tweet' if found, else None.
+            Tuple[Optional[Tweet], Optional[Like]]: The 'Tweet' instance
+            or None if it doesn't exist, and the 'Like' instance or None.
         """
-        app_logger.info("Getting the tweet of the specified like")
+        app_logger.info("Getting the tweet with the like of the user")
+        user_like = aliased(
+            cls,
+            select(cls)
+            .where(cls.tweet_association.any(id=tweet_id))
+            .where(cls.user_association.any(id=user.id))
+            .subquery(),
+        )
         tweet_result = await session.execute(
-            select(Tweet).where(Tweet.id == tweet_id),
+            select(Tweet, user_like)
+            .outerjoin(user_like, true())
+            .where(Tweet.id == tweet_id),
         )
-        return tweet_result.scalars().first()
+        tweet_with_like = tweet_result.first()
+        if tweet_with_like is None:
+            return None, None
+        return tweet_with_like[0], tweet_with_like[1]
 
     @classmethod
     async def delete_like(
@@ -197,31 +210,3 @@ class Like(Base):
             .where(cls.user_association.any(id=user.id)),
         )
         return like_result.scalars().first()
-
-    @classmethod
-    async def has_like(
-        cls,
-        session: AsyncSession,
-        tweet_id: int,
-        user: User,
-    ) -> bool:
-        """
-        Check whether a user has liked a particular tweet.
-
-        Args:
-            session (AsyncSession):
-                The sqlalchemy session.
-            tweet_id (int):
-                The ID of the tweet.
-            user (User):
-                The User instance.
-
-        Returns:
-            bool: True if the user has liked the tweet, else False.
-        """
-        like: Optional["Like"] = await cls.take_like(
-            session=session,
-            tweet_id=tweet_id,
-            user=user,
-        )
-        return bool(like)
@@ -11,6 +11,7 @@ User:
 
 Modules:
 --------
+functools: Provides caching of the built statements
 typing: Provides runtime support for type hints
 sqlalchemy: The Python SQL toolkit and Object-Relational Mapping
 for Python
@@ -25,11 +26,21 @@ application.models.base_model: Contains base SQLAlchemy models
 application.schemas.user_schemas: Contains schemas for the 'User' entity
 """
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, List, NewType, Optional, Tuple, Union
 
-from sqlalchemy import Column, Integer, String, select
+from sqlalchemy import (
+    Column,
+    Integer,
+    Select,
+    String,
+    bindparam,
+    insert,
+    literal,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import backref, joinedload, relationship, subqueryload
+from sqlalchemy.orm import backref, joinedload, relationship, selectinload
 
 from application.errors.self_following_validation import (
     SelfFollowingValidationError,
@@ -236,6 +247,11 @@ class User(Base):
         """
         Let the current user follow another user.
 
+        The subscription is inserted by a single statement, which selects
+        the followed user from the `users` table, so the missing user is
+        detected by the count of the inserted rows. A repeated subscription
+        violates the primary key of the subscription table.
+
         Args:
             session (AsyncSession):
                 SQLAlchemy session to connect to the database.
@@ -251,20 +267,17 @@ class User(Base):
         app_logger.info("Following user")
         if current_user.id == user_to_follow_id:
             raise SelfFollowingValidationError("Cannot follow yourself")
-        user_to_follow: Optional["User"] = await cls.get_user_by_id(
-            session=session,
-            user_id=user_to_follow_id,
+        subscription_result = await session.execute(
+            insert(subscription_table).from_select(
+                ["follower_id", "followed_id"],
+                select(literal(current_user.id), cls.id).where(
+                    cls.id == user_to_follow_id,
+                ),
+            ),
         )
-        if user_to_follow is None:
+        if not subscription_result.rowcount:
+            app_logger.exception(USER_NOT_FOUND_ERROR_MSG)
             raise UserIdValidationError(USER_NOT_FOUND_ERROR_MSG)
-        current_user_with_eager_loaded_attr: "User" = (
-            await cls.get_user_with_eager_load(
-                session=session,
-                user_id=current_user.id,
-            )
-        )
-        current_user_with_eager_loaded_attr.followed.append(user_to_follow)
-        session.add(current_user_with_eager_loaded_attr)
 
     @classmethod
     async def unfollow_user(
@@ -401,6 +414,9 @@ class User(Base):
         """
         Construct a UserResponse object from a User instance.
 
+        The data comes from the database, so the schemas are built
+        without validation.
+
         Args:
             user (Optional[User]):
                 The instance of the user.
@@ -410,16 +426,22 @@ class User(Base):
             User details.
         """
         app_logger.info("Getting user schema")
-        return UserResponse(
-            user=UserSchema(
+        return UserResponse.model_construct(
+            user=UserSchema.model_construct(
                 id=user.id,
                 name=user.name,
                 followers=[
-                    UserConnectionsSchema(id=follower.id, name=follower.name)
+                    UserConnectionsSchema.model_construct(
+                        id=follower.id,
+                        name=follower.name,
+                    )
                     for follower in user.followers
                 ],
                 following=[
-                    UserConnectionsSchema(id=followed.id, name=followed.name)
+                    UserConnectionsSchema.model_construct(
+                        id=followed.id,
+                        name=followed.name,
+                    )
                     for followed in user.followed
                 ],
             ),
@@ -444,16 +466,10 @@ class User(Base):
             List[TweetSchema]: A list of Tweet schemas representing the tweets
                 of the users that the given user follows.
         """
-        current_user_with_related_objects: "User" = (
-            await cls.get_user_with_eager_load(
-                session=session,
-                user_id=user.id,
-            )
-        )
         tweets_of_current_user_followed: Optional[List[tweet_description]] = (
             await cls.take_tweets_of_current_user_followed(
                 session=session,
-                user_with_related_objects=current_user_with_related_objects,
+                user_id=user.id,
             )
         )
         app_logger.info("Showing user's tweets")
@@ -464,15 +480,20 @@ class User(Base):
     @classmethod
     async def take_tweets_of_current_user_followed(
         cls,
-        user_with_related_objects: "User",
+        user_id: int,
         session: AsyncSession,
     ) -> Optional[List[tweet_description]]:
         """
         Get sorted tweets of users that the current user follows.
 
+        The followed users are selected by a subquery, and the related
+        objects of the tweets are loaded by `selectinload`, so the whole
+        feed is taken in a fixed number of round trips. The statement is
+        built once and only the user ID is bound on each call.
+
         Args:
-            user_with_related_objects (User):
-                User object carrying related objects.
+            user_id (int):
+                The ID of the current user.
             session (AsyncSession):
                 The session for asynchronous database operations.
 
@@ -481,28 +502,46 @@ class User(Base):
             details of tweets of users followed by the current user, or None
             if there are no such tweets.
         """
+        tweets_result = await session.execute(
+            cls.make_statement_for_tweets_of_followed(),
+            {"user_id": user_id},
+        )
+        tweets: Optional[List["Tweet"]] = tweets_result.scalars().all()
+        if tweets is not None:
+            return cls.make_list_of_sorted_tweets(tweets_list=tweets)
+        app_logger.info("Tweets of current user are not followed")
+        return None
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def make_statement_for_tweets_of_followed(cls) -> Select:
+        """
+        Build the statement selecting tweets of the users followed.
+
+        The ID of the current user is left as the 'user_id' bound
+        parameter, so the same statement serves every request.
+
+        Returns:
+            Select: The statement with eager loading of the authors,
+            media and likes of the tweets.
+        """
         from application.models.like import Like  # noqa: F811, WPS474
         from application.models.tweet import Tweet
 
-        user_followed_ids: List[int] = [
-            user.id for user in user_with_related_objects.followed
-        ]
-        tweets_result = await session.execute(
+        user_followed_ids = select(subscription_table.c.followed_id).where(
+            subscription_table.c.follower_id == bindparam("user_id"),
+        )
+        return (
             select(Tweet)
             .options(  # type: ignore
-                subqueryload(Tweet.user_association),
-                subqueryload(Tweet.media_association),
-                subqueryload(Tweet.like_association).joinedload(
+                selectinload(Tweet.user_association),
+                selectinload(Tweet.media_association),
+                selectinload(Tweet.like_association).selectinload(
                     Like.user_association,
                 ),
             )
-            .filter(Tweet.user_association.any(cls.id.in_(user_followed_ids))),
+            .filter(Tweet.user_association.any(cls.id.in_(user_followed_ids)))
         )
-        tweets: Optional[List[Tweet]] = tweets_result.scalars().all()
-        if tweets is not None:
-            return cls.make_list_of_sorted_tweets(tweets_list=tweets)
-        app_logger.info("Tweets of current user are not followed")
-        return None
 
     @classmethod
     def make_list_of_sorted_tweets(
@@ -559,6 +598,9 @@ class User(Base):
         """
         Get a list of Tweet schemas.
 
+        The data comes from the database, so the schemas are built
+        without validation.
+
         Args:
             tweets (Optional[List[tweet_description]]):
                 List of tuples containing tweet details.
@@ -566,26 +608,43 @@ class User(Base):
         Returns:
             Union[List, List[TweetSchema]]: A list of Tweet schemas.
         """
-        if tweets is not None:
-            return [
-                TweetSchema(
-                    id=tweet[2].id,
-                    content=str(tweet[2].tweet_data),
-                    attachments=[
-                        "/images/{0}".format(media.file)
-                        for media in tweet[2].media_association
-                    ],
-                    author=UserConnectionsSchema(id=tweet[0], name=tweet[1]),
-                    likes=[
-                        UserConnectionsSchema(
-                            id=liked_user.id,
-                            name=liked_user.name,
-                        )
-                        for like in tweet[2].like_association
-                        for liked_user in like.user_association
-                    ],
-                )
-                for tweet in tweets
-            ]
+        if tweets:
+            return [cls.make_tweet_schema(tweet=tweet) for tweet in tweets]
         app_logger.info("Tweets of current user are not followed")
         return []
+
+    @classmethod
+    def make_tweet_schema(cls, tweet: tweet_description) -> TweetSchema:
+        """
+        Make the Tweet schema without validation.
+
+        Args:
+            tweet (tweet_description):
+                The tuple containing the tweet details.
+
+        Returns:
+            TweetSchema: The schema of the tweet.
+        """
+        author_id, author_name, tweet_model = tweet
+        attachments: List[str] = [
+            "/images/{0}".format(media.file)
+            for media in tweet_model.media_association
+        ]
+        likes: List[UserConnectionsSchema] = [
+            UserConnectionsSchema.model_construct(
+                id=liked_user.id,
+                name=liked_user.name,
+            )
+            for like in tweet_model.like_association
+            for liked_user in like.user_association
+        ]
+        return TweetSchema.model_construct(
+            id=tweet_model.id,
+            content=str(tweet_model.tweet_data),
+            attachments=attachments,
+            author=UserConnectionsSchema.model_construct(
+                id=author_id,
+                name=author_name,
+            ),
+            likes=likes,
+        )
@@ -18,29 +18,36 @@ Modules:
 typing: Provides type hints compatibility.
 fastapi: Provides a highly efficient and easy to use platform for building
 APIs.
+application.api_utils.generate_success_response: Builds responses with
+the prepared basic success body.
+application.api_utils.user_data_cache: Keeps recently requested user
+profiles.
 application.main: Contains the main dependencies for the application.
 application.models.tweet: Contains methods and fields for the 'Tweet' entity.
 application.models.user: Houses methods and fields for the 'User' entity.
 application.models.like: Depicts 'Like' entity with its fields and methods.
 application.schemas.basic_schemas: Includes basic response schemas for the API.
-application.schemas.error_schemas: Includes error response schemas for the API.
+application.routes.responses: Holds the error responses shared by
+the routes.
 application.logger.logger_instance: Controls logging in the application.
 
 """
 
 from typing import Annotated
 
-from fastapi import Depends, Path, Request, status
+from fastapi import Path, Request, status
 
+from application.api_utils.generate_success_response import (
+    generate_success_response,
+)
+from application.api_utils.user_data_cache import invalidate_user_responses
 from application.logger.logger_instance import app_logger
-from application.main import MAIN_DEPENDENCY, api_key_header, app
+from application.main import MAIN_DEPENDENCY, app
 from application.models.like import Like
 from application.models.tweet import Tweet
 from application.models.user import User
+from application.routes.responses import ALL_ERROR_RESPONSES, MODEL_KEY
 from application.schemas.basic_schemas import BasicSuccessResponse
-from application.schemas.error_schemas import GenericError
-
-MODEL_KEY: str = "model"
 
 
 @app.delete(
@@ -50,11 +57,8 @@ MODEL_KEY: str = "model"
     response_description="The tweet deleted",
     responses={
         status.HTTP_200_OK: {MODEL_KEY: BasicSuccessResponse},
-        status.HTTP_400_BAD_REQUEST: {MODEL_KEY: GenericError},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **ALL_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def delete_tweet(
     tweet_id: Annotated[int, Path(description="tweet ID", gt=0)],
@@ -81,7 +85,7 @@ async def delete_tweet(
             session=session, tweet_id=tweet_id, user=request.state.user,
         )
     app_logger.info("Successfully deleted tweet with ID: {0}".format(tweet_id))
-    return BasicSuccessResponse()
+    return generate_success_response(status_code=status.HTTP_200_OK)
 
 
 @app.delete(
@@ -91,11 +95,8 @@ async def delete_tweet(
     response_description="The tweet unliked",
     responses={
         status.HTTP_200_OK: {MODEL_KEY: BasicSuccessResponse},
-        status.HTTP_400_BAD_REQUEST: {MODEL_KEY: GenericError},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **ALL_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def unlike_tweet(
     tweet_id: Annotated[int, Path(description="tweet ID", gt=0)],
@@ -124,7 +125,7 @@ async def unlike_tweet(
             user=request.state.user,
         )
     app_logger.info("Successfully unliked tweet with ID: {0}".format(tweet_id))
-    return BasicSuccessResponse()
+    return generate_success_response(status_code=status.HTTP_200_OK)
 
 
 @app.delete(
@@ -134,11 +135,8 @@ async def unlike_tweet(
     response_description="Unfollowing the user",
     responses={
         status.HTTP_200_OK: {MODEL_KEY: BasicSuccessResponse},
-        status.HTTP_400_BAD_REQUEST: {MODEL_KEY: GenericError},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **ALL_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def unfollow_user(
     session_manager: MAIN_DEPENDENCY,
@@ -166,7 +164,8 @@ async def unfollow_user(
             user_to_unfollow_id=user_id,
             current_user=request.state.user,
         )
+    invalidate_user_responses()
     app_logger.info(
         "Successfully unfollowed user with ID: {0}".format(user_id),
     )
-    return BasicSuccessResponse()
+    return generate_success_response(status_code=status.HTTP_200_OK)
@@ -13,19 +13,25 @@ get_current_user:
 get_user:
     Route for getting a user's information based on the user_id.
 
+The user profiles are served from a short-lived cache when possible.
+
 Modules:
 --------
 typing: Provides type hints compatibility.
 fastapi: Provides a highly efficient and easy to use platform for building
 APIs.
+application.api_utils.pydantic_response: Serializes success schemas
+straight to JSON.
+application.api_utils.user_data_cache: Keeps recently requested user
+profiles.
 application.logger.logger_instance: Manages logging instances across the
 application.
-application.main: Holds core components like api_key_header, app etc. required
-across the application.
+application.main: Holds core components like the session dependency, app etc.
+required across the application.
 application.models.tweet: Contains methods and fields for the 'Tweet' entity.
 application.models.user: Houses methods and fields for the 'User' entity.
-application.schemas.error_schemas: Includes error response schemas for the
-API.
+application.routes.responses: Holds the error responses shared by
+the routes.
 application.schemas.tweet_schemas: Includes response schemas for tweet
 operations.
 application.schemas.user_schemas: Includes response schemas for user
@@ -35,18 +41,25 @@ operations.
 
 from typing import Annotated, List, Optional
 
-from fastapi import Depends, Path, Request, status
+from fastapi import Path, Request, status
 
+from application.api_utils.pydantic_response import PydanticResponse
+from application.api_utils.user_data_cache import (
+    cache_user_response,
+    take_cached_user_response,
+)
 from application.logger.logger_instance import app_logger
-from application.main import MAIN_DEPENDENCY, api_key_header, app
+from application.main import MAIN_DEPENDENCY, app
 from application.models.user import User
-from application.schemas.error_schemas import GenericError
+from application.routes.responses import (
+    ALL_ERROR_RESPONSES,
+    MODEL_KEY,
+    SERVER_ERROR_RESPONSES,
+)
 from application.schemas.tweet_schemas import AllTweetsResponse
 from application.schemas.tweet_schemas import Tweet as TweetSchema
 from application.schemas.user_schemas import UserResponse
 
-MODEL_KEY: str = "model"
-
 
 @app.get(
     "/api/tweets",
@@ -55,9 +68,8 @@ MODEL_KEY: str = "model"
     response_description="A list of all the current user's tweets",
     responses={
         status.HTTP_200_OK: {MODEL_KEY: AllTweetsResponse},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **SERVER_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def get_tweets(
     session_manager: MAIN_DEPENDENCY,
@@ -82,7 +94,10 @@ async def get_tweets(
             session=session,
             user=request.state.user,
         )
-    return AllTweetsResponse(tweets=tweets)
+    return PydanticResponse(
+        content=AllTweetsResponse.model_construct(tweets=tweets),
+        status_code=status.HTTP_200_OK,
+    )
 
 
 @app.get(
@@ -92,9 +107,8 @@ async def get_tweets(
     response_description="The user information",
     responses={
         status.HTTP_200_OK: {MODEL_KEY: UserResponse},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **SERVER_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def get_current_user(
     session_manager: MAIN_DEPENDENCY,
@@ -113,14 +127,16 @@ async def get_current_user(
         User: User instance representing the current user.
     """
     app_logger.info("Getting current user data")
-    async with session_manager as session:
-        user: Optional[UserResponse] = (
-            await User.get_actual_data_of_current_user(
+    user_id: int = request.state.user.id
+    user: Optional[UserResponse] = take_cached_user_response(user_id=user_id)
+    if user is None:
+        async with session_manager as session:
+            user = await User.get_actual_data_of_current_user(
                 session=session,
                 user=request.state.user,
             )
-        )
-    return user
+        cache_user_response(user_id=user_id, user_response=user)
+    return PydanticResponse(content=user, status_code=status.HTTP_200_OK)
 
 
 @app.get(
@@ -130,11 +146,8 @@ async def get_current_user(
     response_description="The selected user information",
     responses={
         status.HTTP_200_OK: {MODEL_KEY: UserResponse},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_400_BAD_REQUEST: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **ALL_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def get_user(
     user_id: Annotated[int, Path(description="user's ID", gt=0)],
@@ -153,11 +166,12 @@ async def get_user(
         User: User instance representing the user with the provided ID.
     """
     app_logger.info("Getting user data by ID")
-    async with session_manager as session:
-        user: Optional[UserResponse] = (
-            await User.get_actual_data_of_user_by_id(
+    user: Optional[UserResponse] = take_cached_user_response(user_id=user_id)
+    if user is None:
+        async with session_manager as session:
+            user = await User.get_actual_data_of_user_by_id(
                 session=session,
                 user_id=user_id,
             )
-        )
-    return user
+        cache_user_response(user_id=user_id, user_response=user)
+    return PydanticResponse(content=user, status_code=status.HTTP_200_OK)
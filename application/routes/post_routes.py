@@ -22,7 +22,13 @@ Modules:
 typing: Provides type hints compatibility.
 fastapi: Provides a highly efficient and easy to use platform for building
 APIs.
-application.main: Holds core components like API key header, app etc.
+application.api_utils.generate_success_response: Builds responses with
+the prepared basic success body.
+application.api_utils.pydantic_response: Serializes success schemas
+straight to JSON.
+application.api_utils.user_data_cache: Keeps recently requested user
+profiles.
+application.main: Holds core components like session dependency, app etc.
 required across the application.
 application.models.tweet: Contains methods and fields for the 'Tweet'
 entity.
@@ -36,29 +42,38 @@ application.schemas.user_schemas: Includes response schemas for user
 operations.
 application.schemas.basic_schemas: Includes basic response schemas
 for the API.
-application.schemas.error_schemas: Includes error response schemas
-for the API.
+application.routes.responses: Holds the error responses shared by
+the routes.
 """
 
 from typing import Annotated, List, Optional
 
-from fastapi import Depends, File, Path, Request, UploadFile, status
+from fastapi import File, Path, Request, UploadFile, status
 
+from application.api_utils.generate_success_response import (
+    generate_success_response,
+)
+from application.api_utils.pydantic_response import PydanticResponse
+from application.api_utils.user_data_cache import invalidate_user_responses
 from application.api_utils.user_data_processing import (
     hash_api_key,
     shield_incoming_data,
 )
 from application.logger.logger_instance import app_logger
-from application.main import MAIN_DEPENDENCY, api_key_header, app
+from application.main import MAIN_DEPENDENCY, app
 from application.models.like import Like
 from application.models.media import Media
 from application.models.tweet import Tweet
 from application.models.user import User
+from application.routes.responses import (
+    ALL_ERROR_RESPONSES,
+    MODEL_KEY,
+    VALIDATION_ERROR_RESPONSES,
+)
 from application.schemas.basic_schemas import (
     BasicSuccessResponse,
     ExtendedSuccessResponse,
 )
-from application.schemas.error_schemas import GenericError
 from application.schemas.tweet_schemas import (
     MediaResponse,
     TweetRequest,
@@ -66,8 +81,6 @@ from application.schemas.tweet_schemas import (
 )
 from application.schemas.user_schemas import UserRequest
 
-MODEL_KEY: str = "model"
-
 
 @app.post(
     "/api/tweets",
@@ -76,11 +89,8 @@ MODEL_KEY: str = "model"
     response_description="The tweet posted",
     responses={
         status.HTTP_201_CREATED: {MODEL_KEY: TweetResponse},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_400_BAD_REQUEST: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **ALL_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def create_tweet(
     session_manager: MAIN_DEPENDENCY,
@@ -122,7 +132,10 @@ async def create_tweet(
         "Successfully created new tweet with ID: {0}".format(new_tweet_id),
     )
     if new_tweet_id:
-        return TweetResponse(tweet_id=new_tweet_id)
+        return PydanticResponse(
+            content=TweetResponse.model_construct(tweet_id=new_tweet_id),
+            status_code=status.HTTP_201_CREATED,
+        )
 
 
 @app.post(
@@ -132,11 +145,8 @@ async def create_tweet(
     response_description="The media file posted",
     responses={
         status.HTTP_201_CREATED: {MODEL_KEY: MediaResponse},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_400_BAD_REQUEST: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **ALL_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 # fmt: off
 async def create_media(
@@ -167,7 +177,10 @@ async def create_media(
         "Successfully created new media with ID: {0}".format(new_media_id),
     )
     if new_media_id:
-        return MediaResponse(media_id=new_media_id)
+        return PydanticResponse(
+            content=MediaResponse.model_construct(media_id=new_media_id),
+            status_code=status.HTTP_201_CREATED,
+        )
 
 
 @app.post(
@@ -177,11 +190,8 @@ async def create_media(
     response_description="The tweet liked",
     responses={
         status.HTTP_201_CREATED: {MODEL_KEY: BasicSuccessResponse},
-        status.HTTP_400_BAD_REQUEST: {MODEL_KEY: GenericError},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **ALL_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def like_tweet(
     tweet_id: Annotated[int, Path(description="tweet ID", gt=0)],
@@ -211,7 +221,7 @@ async def like_tweet(
             user=request.state.user,
         )
     app_logger.info("Successfully liked a tweet")
-    return BasicSuccessResponse()
+    return generate_success_response(status_code=status.HTTP_201_CREATED)
 
 
 @app.post(
@@ -221,11 +231,8 @@ async def like_tweet(
     response_description="Following the user",
     responses={
         status.HTTP_201_CREATED: {MODEL_KEY: BasicSuccessResponse},
-        status.HTTP_400_BAD_REQUEST: {MODEL_KEY: GenericError},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **ALL_ERROR_RESPONSES,
     },
-    dependencies=[Depends(api_key_header)],
 )
 async def follow_user(
     user_id: Annotated[int, Path(description="user's ID", gt=0)],
@@ -254,8 +261,9 @@ async def follow_user(
             user_to_follow_id=user_id,
             current_user=request.state.user,
         )
+    invalidate_user_responses()
     app_logger.info("Successfully followed the user")
-    return BasicSuccessResponse()
+    return generate_success_response(status_code=status.HTTP_201_CREATED)
 
 
 @app.post(
@@ -265,8 +273,7 @@ async def follow_user(
     response_description="New user added",
     responses={
         status.HTTP_201_CREATED: {MODEL_KEY: ExtendedSuccessResponse},
-        status.HTTP_422_UNPROCESSABLE_ENTITY: {MODEL_KEY: GenericError},
-        status.HTTP_500_INTERNAL_SERVER_ERROR: {MODEL_KEY: GenericError},
+        **VALIDATION_ERROR_RESPONSES,
     },
 )
 async def create_user(
@@ -299,4 +306,7 @@ async def create_user(
         "Successfully created new user with ID: {0}".format(new_user_id),
     )
     if new_user_id:
-        return ExtendedSuccessResponse(id=new_user_id)
+        return PydanticResponse(
+            content=ExtendedSuccessResponse.model_construct(id=new_user_id),
+            status_code=status.HTTP_201_CREATED,
+        )
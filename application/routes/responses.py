@@ -0,0 +1,85 @@
+"""
+This module holds the error responses shared by the API routes.
+
+The routes describe the same error schema for every failing status code,
+so the read-only tables are built once here and combined with the success
+response of each route.
+
+Modules:
+--------
+types: Provides the read-only view of the responses.
+typing: Provides type hints compatibility.
+fastapi: Provides the HTTP status codes.
+application.schemas.error_schemas: Includes error response schemas for the
+API.
+
+Variables:
+----------
+response_description:
+    The type of the description of a response.
+route_responses:
+    The type of the responses of a route.
+MODEL_KEY:
+    The key of the response model in the route responses.
+SERVER_ERROR_CODES, VALIDATION_ERROR_CODES, ALL_ERROR_CODES:
+    The status codes of the errors of the routes.
+SERVER_ERROR_RESPONSES:
+    Errors of the routes that don't take any input.
+VALIDATION_ERROR_RESPONSES:
+    Errors of the routes that only validate the input.
+ALL_ERROR_RESPONSES:
+    Errors of the routes that validate the input and check the entities.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Union
+
+from fastapi import status
+
+from application.schemas.error_schemas import GenericError
+
+response_description = Dict[str, Any]
+route_responses = Mapping[Union[int, str], response_description]
+
+MODEL_KEY: str = "model"
+
+SERVER_ERROR_CODES: Tuple[int, ...] = (
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+)
+VALIDATION_ERROR_CODES: Tuple[int, ...] = (
+    status.HTTP_422_UNPROCESSABLE_ENTITY,
+    *SERVER_ERROR_CODES,
+)
+ALL_ERROR_CODES: Tuple[int, ...] = (
+    status.HTTP_400_BAD_REQUEST,
+    *VALIDATION_ERROR_CODES,
+)
+
+
+def make_error_responses(status_codes: Tuple[int, ...]) -> route_responses:
+    """
+    Make the read-only error responses for the status codes.
+
+    Args:
+        status_codes (Tuple[int, ...]): The status codes of the errors.
+
+    Returns:
+        route_responses: The error schema for each of the status codes.
+    """
+    return MappingProxyType(
+        {
+            status_code: {MODEL_KEY: GenericError}
+            for status_code in status_codes
+        },
+    )
+
+
+SERVER_ERROR_RESPONSES: route_responses = make_error_responses(
+    status_codes=SERVER_ERROR_CODES,
+)
+VALIDATION_ERROR_RESPONSES: route_responses = make_error_responses(
+    status_codes=VALIDATION_ERROR_CODES,
+)
+ALL_ERROR_RESPONSES: route_responses = make_error_responses(
+    status_codes=ALL_ERROR_CODES,
+)
@@ -34,7 +34,7 @@ application.schemas.user_schemas: Contains user-related schemas.
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from application.schemas.basic_schemas import BasicSuccessResponse
 from application.schemas.user_schemas import UserConnections
@@ -58,6 +58,8 @@ class Tweet(BaseModel):
         Users who liked this Tweet.
     """
 
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
+
     id: int = Field(..., description="Tweet ID")
     content: str = Field(..., description="Tweet content")  # noqa: WPS110
     attachments: Optional[List[str]] = Field(
@@ -29,7 +29,7 @@ application.schemas.basic_schemas: Contains basic response schemas.
 
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from application.schemas.basic_schemas import BasicSuccessResponse
 
@@ -46,6 +46,8 @@ class UserConnections(BaseModel):
         Name of the connected user.
     """
 
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
+
     id: int = Field(..., description="User ID")
     name: str = Field(..., description="User name")
 
@@ -66,6 +68,8 @@ class User(BaseModel):
         List of users this User is following.
     """
 
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
+
     id: int = Field(..., description="User ID")
     name: str = Field(..., description="User name")
     followers: List[UserConnections] = Field(
@@ -0,0 +1,153 @@
+"""
+Provides the pure ASGI middleware of the testing application.
+
+The middlewares registered by the `middleware("http")` decorator are
+wrapped into Starlette's `BaseHTTPMiddleware`, which builds the request
+and response objects and runs the endpoint in a separate task for each
+request. The class below works with the ASGI messages directly and
+shares the logic with the middlewares of the main application.
+The mapped errors of the routes are handled by the exception handlers
+of the application. Any other exception reaches the middleware, which
+sends the internal server error response for it, unless the response
+has already been started. Such an exception is raised again, since
+the second start of the response would hide it.
+
+Modules:
+--------
+typing: For type annotations
+starlette.types: ASGI type annotations
+application.middlewares.api_key_authentication: Middleware for
+checking API key
+application.middlewares.exception_middleware: Middleware for
+handling exceptions
+application.models.user: Module including the User model
+
+Classes:
+--------
+ResponseStartTracker:
+    Passes the outgoing messages on and remembers the response start.
+ApiKeyASGIMiddleware:
+    Authenticates the HTTP requests by the API key.
+"""
+
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.middlewares.api_key_authentication import authenticate
+from application.middlewares.exception_middleware import ErrorHandler
+from application.models.user import User
+
+API_KEY_HEADER: bytes = b"api-key"
+RESPONSE_START_MESSAGE: str = "http.response.start"
+
+
+class ResponseStartTracker:
+    """Passes the outgoing messages on and remembers the response start."""
+
+    def __init__(self, send: Send) -> None:
+        """
+        Wrap the channel for outgoing messages.
+
+        Args:
+            send (Send): The channel for outgoing messages.
+        """
+        self.send = send
+        self.response_started = False
+
+    async def __call__(self, message: Message) -> None:
+        """
+        Send the message and mark the start of the response.
+
+        Args:
+            message (Message): The outgoing message.
+        """
+        if message["type"] == RESPONSE_START_MESSAGE:
+            self.response_started = True
+        await self.send(message)
+
+
+class ApiKeyASGIMiddleware:
+    """
+    Authenticates the HTTP requests by the API key.
+
+    The found user is put into the request state, where the routes
+    take it from. The middleware runs outside the exception handlers
+    of the application, so it sends the error responses of the failed
+    authentication and of the exceptions without a mapping by itself.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Wrap the ASGI application.
+
+        Args:
+            app (ASGIApp): The next application in the middleware stack.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """
+        Authenticate the HTTP request and pass it further.
+
+        Any exception which is not handled by the application is turned
+        into the error response. If the response has already been started,
+        the exception is raised again.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel for incoming messages.
+            send (Send): The channel for outgoing messages.
+
+        Raises:
+            Exception: The exception raised after the start of
+                the response.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        tracked_send = ResponseStartTracker(send=send)
+        try:
+            await self.handle_request(scope, receive, tracked_send)
+        except Exception as exc:
+            if tracked_send.response_started:
+                raise
+            error_response = ErrorHandler.generate_response(exc=exc)
+            await error_response(scope, receive, send)
+
+    async def handle_request(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """
+        Authenticate the HTTP request and pass it to the application.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The channel for incoming messages.
+            send (Send): The channel for outgoing messages.
+        """
+        await self.authenticate(scope=scope)
+        await self.app(scope, receive, send)
+
+    @classmethod
+    async def authenticate(cls, scope: Scope) -> None:
+        """
+        Authenticate the HTTP request by the API key.
+
+        Args:
+            scope (Scope): The connection scope.
+        """
+        api_key: Optional[str] = None
+        for header_name, header_value in scope["headers"]:
+            if header_name == API_KEY_HEADER:
+                api_key = header_value.decode("latin-1")
+                break
+        user: Optional[User] = await authenticate(
+            path=scope["path"],
+            api_key=api_key,
+        )
+        if user is not None:
+            scope.setdefault("state", {})["user"] = user
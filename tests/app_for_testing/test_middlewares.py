@@ -0,0 +1,92 @@
+"""
+This module contains tests for the ASGI middleware of the testing app.
+
+The exceptions without a mapping in `ErrorHandler` are not registered
+as the exception handlers of the application, so the middleware must
+turn them into the internal server error response instead of letting
+them out of the application. An exception raised after the start of the
+response can't be answered by another response, so it must come out
+unchanged.
+
+Modules:
+--------
+- pytest: For creating unit tests.
+- httpx: For sending the requests to the wrapped application.
+- starlette.types: ASGI type annotations.
+- tests.app_for_testing.middlewares: The tested middleware.
+- tests.helpers.assertation_checker: For validating responses.
+- tests.helpers.values: To use predefined constants.
+
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from tests.app_for_testing.middlewares import ApiKeyASGIMiddleware
+from tests.helpers.assertation_checker import (
+    negative_result_assertation_checker,
+)
+from tests.helpers.values import ADD_USER_ROUTE, BASE_URL
+
+pytestmark = pytest.mark.readonly
+
+
+async def failing_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """
+    Fail the handling of any request by an exception without a mapping.
+
+    Args:
+        scope (Scope): The connection scope.
+        receive (Receive): The channel for incoming messages.
+        send (Send): The channel for outgoing messages.
+
+    Raises:
+        RuntimeError: Always.
+    """
+    raise RuntimeError("Unexpected error of the route")
+
+
+async def failing_after_start_app(
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+) -> None:
+    """
+    Start the response and fail by an exception without a mapping.
+
+    Args:
+        scope (Scope): The connection scope.
+        receive (Receive): The channel for incoming messages.
+        send (Send): The channel for outgoing messages.
+
+    Raises:
+        RuntimeError: Always.
+    """
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    raise RuntimeError("Unexpected error of the started response")
+
+
+async def test_unmapped_exception_gives_error_response() -> None:
+    """Check the response to the exception without a mapping."""
+    middleware = ApiKeyASGIMiddleware(app=failing_app)
+    async with AsyncClient(
+        transport=ASGITransport(app=middleware),  # type: ignore
+        base_url=BASE_URL,
+    ) as async_client:
+        response = await async_client.post(url=ADD_USER_ROUTE)
+    negative_result_assertation_checker(
+        response=response,
+        error_type="internal server error",
+    )
+
+
+async def test_exception_after_response_start_is_raised() -> None:
+    """Check that the exception after the response start is not hidden."""
+    middleware = ApiKeyASGIMiddleware(app=failing_after_start_app)
+    async with AsyncClient(
+        transport=ASGITransport(app=middleware),  # type: ignore
+        base_url=BASE_URL,
+    ) as async_client:
+        with pytest.raises(RuntimeError, match="started response"):
+            await async_client.post(url=ADD_USER_ROUTE)
@@ -2,35 +2,66 @@
 This module sets up basic Fixtures for the pytest to use during testing.
 
 The fixtures handle setting up and tearing down the testing database tables.
+The tables are created once per session and emptied after each test.
 
 Modules:
 --------
-- pytest to provide fixtures
-- httpx to create an AsyncClient object for client simulation
-- ASGITransport from httpx to transport requests for the AsyncClient
-    object
+- pytest to provide fixtures and markers
+- pytest_asyncio for the async fixtures
+- invalidate_user_responses from application.api_utils.user_data_cache
+    to drop the cached user profiles between tests
+- authenticated_users_cache from
+    application.middlewares.api_key_authentication to forget the users
+    authenticated in the previous test
 - Base from application.models.base_model to interact with database schema
+- User from application.models.user to keep the users of the session
 - test_engine from application.database.connection for setting up and tearing
     down the database
+- tests.helpers.database_seeding to add the users once per session
+- forget_loaded_snapshot from tests.helpers.database_snapshot to clean up
+    after the read-only tests
+- tests.helpers.helpers_for_media_adding to prepare the uploaded media
+    once
+
+The command line options, the collection hook and the event loop policy
+of the session are provided by the plugin `tests.helpers.pytest_options`,
+the clients sending the requests by the plugin
+`tests.helpers.client_fixtures`.
 
 """
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, Tuple
 
+import pytest
 import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
 
+from application.api_utils.user_data_cache import invalidate_user_responses
 from application.database.connection import test_engine
+from application.middlewares.api_key_authentication import (
+    authenticated_users_cache,
+)
 from application.models.base_model import Base
-from tests.app_for_testing.application import test_app
-from tests.helpers.values import BASE_URL
-
-
-@pytest_asyncio.fixture(scope="function", autouse=True)
+from application.models.user import User
+from tests.helpers.database_seeding import TESTING_USER_IDS, insert_users
+from tests.helpers.database_snapshot import forget_loaded_snapshot
+from tests.helpers.helpers_for_media_adding import (
+    WRONG_MEDIA_PATH,
+    make_media_content,
+    make_wrong_media_content,
+)
+
+pytest_plugins = (
+    "tests.helpers.pytest_options",
+    "tests.helpers.client_fixtures",
+)
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
 async def set_up_testing_database() -> AsyncGenerator:
     """
-    Use to set up the testing database before each test.
+    Use to set up the testing database once for the whole session.
 
     Done by creating all tables in the Base metadata using the test_engine.
+    The tables are dropped after the last test.
 
     Yields:
         None.
@@ -40,29 +71,89 @@ async def set_up_testing_database() -> AsyncGenerator:
     async with test_engine.begin() as connection:
         await connection.run_sync(Base.metadata.create_all)
     yield
+    async with test_engine.begin() as cleanup_connection:
+        await cleanup_connection.run_sync(Base.metadata.drop_all)
 
 
-@pytest_asyncio.fixture(scope="function")
-async def take_async_client() -> AsyncGenerator:
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def prepare_users(set_up_testing_database) -> None:
     """
-    Yield an AsyncClient object that tests can use to make requests.
+    Add the users performing the requests once for the whole session.
 
-    Yields:
-        An instance of AsyncClient.
+    The users are inserted into the database directly and kept by the
+    cleanup after each test.
+
+    Args:
+        set_up_testing_database: Fixture creating the tables.
+    """
+    await insert_users()
+
+
+@pytest.fixture(scope="session")
+def cached_media_content() -> Dict[str, Tuple[str, bytes, str]]:
+    """
+    Prepare the files of the media upload request once per session.
+
+    Returns:
+        Dict[str, Tuple[str, bytes, str]]: The name, the bytes' content
+            and the type of the uploaded file.
+    """
+    return make_media_content()
+
+
+@pytest.fixture(scope="session")
+def wrong_media_content() -> Dict[str, Tuple[str, bytes, str]]:
+    """
+    Prepare the files of the upload request with a non-image file.
+
+    The file is resolved relative to the project root, so the content
+    doesn't depend on the working directory of the test run.
+
+    Returns:
+        Dict[str, Tuple[str, bytes, str]]: The name, the bytes' content
+            and the type of the uploaded file.
+    """
+    return make_wrong_media_content(
+        file_path=WRONG_MEDIA_PATH,
+        file_type="text/markdown",
+    )
+
+
+async def clean_testing_database() -> None:
+    """
+    Delete the rows of all tables and drop the data cached from them.
+
+    The tables are emptied in the reverse order of their dependencies,
+    so the identifiers start from one again in the following test.
+    The users prepared for the session are kept.
+    The cached user profiles and authenticated users are dropped as well,
+    since they refer to the removed rows.
     """
-    async with AsyncClient(
-        base_url=BASE_URL,
-        transport=ASGITransport(app=test_app),  # type: ignore
-    ) as async_client:
-        yield async_client
+    async with test_engine.begin() as cleanup_connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            cleanup_statement = table.delete()
+            if table is User.__table__:
+                cleanup_statement = cleanup_statement.where(
+                    User.id.not_in(TESTING_USER_IDS),
+                )
+            await cleanup_connection.execute(cleanup_statement)
+    invalidate_user_responses()
+    authenticated_users_cache.clear()
 
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
-async def teardown_testing_database() -> AsyncGenerator:
+async def teardown_testing_database(request) -> AsyncGenerator:
     """
     Use to clean up the testing database after each test.
 
-    Done by dropping all tables in the Base metadata using the test_engine.
+    Done by deleting the rows of all tables in the Base metadata using
+    the test_engine, which is much cheaper than recreating the schema.
+    The tests marked as `readonly` leave the database as is, so the
+    following read-only tests reuse their data. It is cleaned up before
+    the next test which isn't read-only.
+
+    Args:
+        request: The request of the test using the fixture.
 
     Yields:
         None.
@@ -70,6 +161,9 @@ async def teardown_testing_database() -> AsyncGenerator:
         execution.
         Automatically used due to 'autouse=True'.
     """
+    readonly: bool = request.node.get_closest_marker("readonly") is not None
+    if not readonly and forget_loaded_snapshot():
+        await clean_testing_database()
     yield
-    async with test_engine.begin() as cleanup_connection:
-        await cleanup_connection.run_sync(Base.metadata.drop_all)
+    if not readonly:
+        await clean_testing_database()
@@ -8,13 +8,19 @@ Specifically, we check the status codes, data structure types and data content.
 Modules:
 --------
 - `httpx` for `Response` type
+- `orjson` for fast parsing of the response bodies
+- `types` for the read-only mapping of the error status codes
 - `typing` for optional and type hinting
+- `weakref` for caching of the parsed bodies while the responses live
 - `tests.helpers.values` for reference values
 
 """
 
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+from weakref import WeakKeyDictionary
 
+import orjson
 from httpx import Response
 
 from tests.helpers.values import (
@@ -27,6 +33,38 @@ from tests.helpers.values import (
     UNSUCCESSFUL_RESULT,
 )
 
+STATUS_CODES_OF_ERRORS: Mapping[str, int] = MappingProxyType(
+    {
+        "bad request": BAD_REQUEST_STATUS_CODE,
+        "unprocessable entity": UNPROCESSABLE_ENTITY_CODE,
+        "internal server error": INTERNAL_ERROR_STATUS_CODE,
+    },
+)
+
+parsed_responses: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def take_response_json(response: Response) -> Dict:
+    """
+    Return the parsed body of the response.
+
+    The body is parsed once per response, the following calls take it
+    from the cache, which forgets the response as soon as it is
+    collected.
+
+    Args:
+        response (Response):
+            HTTP response object.
+
+    Returns:
+        Dict: The parsed body.
+    """
+    response_json: Optional[Dict] = parsed_responses.get(response)
+    if response_json is None:
+        response_json = orjson.loads(response.content)
+        parsed_responses[response] = response_json
+    return response_json  # type: ignore
+
 
 def negative_result_assertation_checker(
     response: Response,
@@ -42,19 +80,14 @@ def negative_result_assertation_checker(
         response (Response):
             HTTP response object.
         error_type (str):
-            The expected error type.
+            The expected error type. It must be one of the keys of
+            `STATUS_CODES_OF_ERRORS`, an unknown type raises KeyError.
     """
-    if error_type == "bad request":
-        assert response.status_code == BAD_REQUEST_STATUS_CODE
-    if error_type == "unprocessable entity":
-        assert response.status_code == UNPROCESSABLE_ENTITY_CODE
-    if error_type == "internal server error":
-        assert response.status_code == INTERNAL_ERROR_STATUS_CODE
-
-    response_json: Dict = response.json()
-    assert response_json.get("result") == UNSUCCESSFUL_RESULT
-    assert isinstance(response_json.get("error_type"), str)
-    assert isinstance(response_json.get("error_message"), str)
+    assert response.status_code == STATUS_CODES_OF_ERRORS[error_type]
+    response_json: Dict = take_response_json(response)
+    assert response_json["result"] == UNSUCCESSFUL_RESULT
+    assert isinstance(response_json["error_type"], str)
+    assert isinstance(response_json["error_message"], str)
 
 
 def positive_result_assertation_checker(
@@ -81,10 +114,10 @@ def positive_result_assertation_checker(
         if delete_instance
         else ADDED_STATUS_CODE
     )
-    response_json: Dict = response.json()
-    assert response_json.get("result") == SUCCESS_RESULT
+    response_json: Dict = take_response_json(response)
+    assert response_json["result"] == SUCCESS_RESULT
     if created_instance:
-        assert isinstance(response_json.get(created_instance), int)
+        assert isinstance(response_json[created_instance], int)
 
 
 def user_info_assertation_checker(response: Response) -> None:
@@ -96,20 +129,14 @@ def user_info_assertation_checker(response: Response) -> None:
             HTTP response object.
     """
     assert response.status_code == SUCCESS_STATUS_CODE
-    response_json: Dict = response.json()
-    assert response_json.get("result") == SUCCESS_RESULT
-    assert isinstance(response_json.get("user"), dict)
-    user: Dict = response_json.get("user")  # type: ignore
-    assert isinstance(user.get("id"), int)
-    assert isinstance(user.get("name"), str)
-    assert isinstance(
-        user.get("followers")[0].get("id"),  # type: ignore
-        int,
-    )
-    assert isinstance(
-        user.get("following")[0].get("name"),  # type: ignore
-        str,
-    )
+    response_json: Dict = take_response_json(response)
+    assert response_json["result"] == SUCCESS_RESULT
+    user: Dict = response_json["user"]
+    assert isinstance(user, dict)
+    assert isinstance(user["id"], int)
+    assert isinstance(user["name"], str)
+    assert isinstance(user["followers"][0]["id"], int)
+    assert isinstance(user["following"][0]["name"], str)
 
 
 def user_tweets_assertation_checker(response: Response) -> None:
@@ -121,25 +148,22 @@ def user_tweets_assertation_checker(response: Response) -> None:
             HTTP response object.
     """
     assert response.status_code == SUCCESS_STATUS_CODE
-    response_json: Dict = response.json()
-    assert response_json.get("result") == SUCCESS_RESULT
-    tweets: Dict = response_json.get("tweets")  # type: ignore
+    response_json: Dict = take_response_json(response)
+    assert response_json["result"] == SUCCESS_RESULT
+    tweets: List[Dict] = response_json["tweets"]
     assert isinstance(tweets, list)
     tweet_data: Dict = tweets[0]
     assert isinstance(tweet_data, dict)
-    assert isinstance(tweet_data.get("id"), int)
-    assert isinstance(tweet_data.get("content"), str)
-    assert isinstance(tweet_data.get("attachments"), list)
-    assert isinstance(
-        tweets[0].get("attachments")[0],
-        str,
-    )
-    author: Dict = tweet_data.get("author")
+    assert isinstance(tweet_data["id"], int)
+    assert isinstance(tweet_data["content"], str)
+    assert isinstance(tweet_data["attachments"], list)
+    assert isinstance(tweet_data["attachments"][0], str)
+    author: Dict = tweet_data["author"]
     assert isinstance(author, dict)
-    assert isinstance(author.get("id"), int)
-    assert isinstance(author.get("name"), str)
-    likes: list = tweet_data.get("likes")
+    assert isinstance(author["id"], int)
+    assert isinstance(author["name"], str)
+    likes: List[Dict] = tweet_data["likes"]
     assert isinstance(likes, list)
     assert isinstance(likes[0], dict)
-    assert isinstance(likes[0].get("id"), int)
-    assert isinstance(likes[0].get("name"), str)
+    assert isinstance(likes[0]["id"], int)
+    assert isinstance(likes[0]["name"], str)
@@ -0,0 +1,27 @@
+"""
+This module contains the types of the parametrized test cases.
+
+The tables of the test cases are shared by several test modules, so
+their types are named once here instead of being spelled out in each
+annotation.
+
+Uses:
+-----
+- `typing` for type hinting.
+
+Types:
+------
+- `ParamCases`: a table of the `pytest.param` cases.
+- `ErrorCase`: the route of a rejected request and the type of its error.
+- `MediaIds`: the media IDs of a tweet, which may hold the placeholder of
+    a media added for the test.
+- `RequestBody`: the JSON body of a request.
+
+"""
+
+from typing import Any, Dict, List, Tuple, Union
+
+ParamCases = Tuple[Any, ...]
+ErrorCase = Tuple[str, str]
+MediaIds = List[Union[int, str]]
+RequestBody = Dict[str, Any]
@@ -0,0 +1,99 @@
+"""
+This module is the pytest plugin providing the testing clients.
+
+The clients send the requests to the testing app in-process. Each of
+them is created once per session, the clients of the users send the
+API key of their user with every request.
+
+Uses:
+-----
+- `typing` for type hinting.
+- `pytest_asyncio` for the async fixtures.
+- `httpx` to create the AsyncClient objects for client simulation.
+- `tests.app_for_testing.application` for the testing app.
+- `tests.helpers.values` for the base URL, the timeout and the headers
+    of the users.
+
+"""
+
+from typing import AsyncGenerator, Mapping, Optional
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from tests.app_for_testing.application import test_app
+from tests.helpers.values import (
+    BASE_URL,
+    TIMEOUT,
+    base_header,
+    base_header_for_the_second_user,
+)
+
+
+def make_async_client(
+    headers: Optional[Mapping[str, str]] = None,
+) -> AsyncClient:
+    """
+    Make an AsyncClient object sending the requests to the testing app.
+
+    The headers and the timeout are set once on the client, so the
+    requests don't pass them each time. The requests never leave the
+    process, so the client doesn't look up the proxy settings in the
+    environment.
+
+    Args:
+        headers (Optional[Mapping[str, str]]):
+            The headers added to each request.
+
+    Returns:
+        An instance of AsyncClient.
+    """
+    return AsyncClient(
+        base_url=BASE_URL,
+        transport=ASGITransport(app=test_app),  # type: ignore
+        headers=headers,
+        timeout=TIMEOUT,
+        trust_env=False,
+    )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def take_async_client() -> AsyncGenerator:
+    """
+    Yield an AsyncClient object that tests can use to make requests.
+
+    The client is created once and shared by all the tests of the session.
+    It keeps no state between the requests and sends no API key, the tests
+    pass the headers they check by themselves.
+
+    Yields:
+        An instance of AsyncClient.
+    """
+    async with make_async_client() as async_client:
+        yield async_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def take_first_user_client() -> AsyncGenerator:
+    """
+    Yield an AsyncClient object sending the API key of the first user.
+
+    Yields:
+        An instance of AsyncClient.
+    """
+    async with make_async_client(headers=base_header) as async_client:
+        yield async_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def take_second_user_client() -> AsyncGenerator:
+    """
+    Yield an AsyncClient object sending the API key of the second user.
+
+    Yields:
+        An instance of AsyncClient.
+    """
+    async with make_async_client(
+        headers=base_header_for_the_second_user,
+    ) as async_client:
+        yield async_client
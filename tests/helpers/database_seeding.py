@@ -0,0 +1,184 @@
+"""
+This module contains functions for seeding the testing database.
+
+The fixtures preparing tweets, media, likes and subscriptions insert the
+rows through the ORM session directly. Passing such data through the HTTP
+routes costs the routing, validation and serialization of each request,
+while the routes themselves are covered by their own tests.
+The media rows only keep the name of the file, nothing is written to disk.
+The testing sessions share a single connection to the in-memory database,
+so the independent rows are batched into one statement instead of being
+inserted concurrently.
+
+Uses:
+-----
+- `typing` for type hinting.
+- `sqlalchemy` for inserting into the association table.
+- `application.api_utils.user_data_processing` for hashing the API keys.
+- `application.database.connection` for the testing database session.
+- `application.models` for the models of the seeded rows.
+- `tests.helpers.values` for the IDs of the users and the content of the
+    seeded tweets.
+
+"""
+
+from typing import Sequence, Tuple
+
+from sqlalchemy import insert, select
+
+from application.api_utils.user_data_processing import hash_api_key
+from application.database.connection import get_session
+from application.models.associations import subscription_table
+from application.models.like import Like
+from application.models.media import Media
+from application.models.tweet import Tweet
+from application.models.user import User
+from tests.helpers.values import (
+    SECOND_USER_ID,
+    USER_ID,
+    VALUE_OF_TWEET_DATA_FIELD,
+)
+
+MEDIA_FILE_NAME: str = "twitter_clone_logo.jpg"
+TESTING_USERS: Tuple[Tuple[int, str, str], ...] = (
+    (USER_ID, "Bob", "test"),
+    (SECOND_USER_ID, "Pit", "second-test"),
+)
+TESTING_USER_IDS: Tuple[int, ...] = (USER_ID, SECOND_USER_ID)
+
+
+async def insert_users() -> None:
+    """
+    Insert the users performing the requests of the tests.
+
+    The users get the IDs and the API keys used by the tests, the keys
+    are hashed the same way as by the route adding a user.
+    """
+    async with get_session(testing=True) as session:
+        session.add_all(
+            [
+                User(id=user_id, name=name, api_key=hash_api_key(api_key))
+                for user_id, name, api_key in TESTING_USERS
+            ],
+        )
+
+
+async def insert_media(file_name: str = MEDIA_FILE_NAME) -> int:
+    """
+    Insert a media row.
+
+    Args:
+        file_name (str):
+            The name of the file kept by the media.
+
+    Returns:
+        int: The ID of the inserted media.
+    """
+    async with get_session(testing=True) as session:
+        media = Media(file=file_name)
+        session.add(media)
+        await session.flush()
+        return int(media.id)
+
+
+async def insert_tweet(
+    user_id: int,
+    media_ids: Sequence[int] = (),
+    tweet_data: str = VALUE_OF_TWEET_DATA_FIELD,
+) -> int:
+    """
+    Insert a tweet of the user with the given media.
+
+    Args:
+        user_id (int):
+            The ID of the author of the tweet.
+        media_ids (Sequence[int]):
+            The IDs of the media attached to the tweet.
+        tweet_data (str):
+            The content of the tweet.
+
+    Returns:
+        int: The ID of the inserted tweet.
+    """
+    async with get_session(testing=True) as session:
+        tweet = Tweet(
+            tweet_data=tweet_data,
+            user_association=[await session.get(User, user_id)],
+        )
+        if media_ids:
+            media_result = await session.execute(
+                select(Media).where(Media.id.in_(media_ids)),
+            )
+            tweet.media_association.extend(media_result.scalars().all())
+        session.add(tweet)
+        await session.flush()
+        return int(tweet.id)
+
+
+async def insert_tweet_with_media(
+    user_id: int,
+    file_name: str = MEDIA_FILE_NAME,
+) -> int:
+    """
+    Insert a media row and a tweet of the user with the media attached.
+
+    Args:
+        user_id (int):
+            The ID of the author of the tweet.
+        file_name (str):
+            The name of the file kept by the media.
+
+    Returns:
+        int: The ID of the inserted tweet.
+    """
+    media_id: int = await insert_media(file_name=file_name)
+    return await insert_tweet(user_id=user_id, media_ids=[media_id])
+
+
+async def insert_like(user_id: int, tweet_id: int) -> None:
+    """
+    Insert a like of the tweet by the user.
+
+    Args:
+        user_id (int):
+            The ID of the user liking the tweet.
+        tweet_id (int):
+            The ID of the liked tweet.
+    """
+    async with get_session(testing=True) as session:
+        like = Like(
+            user_association=[await session.get(User, user_id)],
+            tweet_association=[await session.get(Tweet, tweet_id)],
+        )
+        session.add(like)
+
+
+async def insert_subscriptions(*subscriptions: Tuple[int, int]) -> None:
+    """
+    Insert subscriptions of users to each other by a single statement.
+
+    Args:
+        subscriptions (Tuple[int, int]):
+            The pairs of the IDs of the subscribing and the followed user.
+    """
+    async with get_session(testing=True) as session:
+        await session.execute(
+            insert(subscription_table),
+            [
+                {"follower_id": follower_id, "followed_id": followed_id}
+                for follower_id, followed_id in subscriptions
+            ],
+        )
+
+
+async def insert_mutual_subscriptions(user_id: int, friend_id: int) -> None:
+    """
+    Insert subscriptions of two users to each other.
+
+    Args:
+        user_id (int):
+            The ID of the first user.
+        friend_id (int):
+            The ID of the second user.
+    """
+    await insert_subscriptions((user_id, friend_id), (friend_id, user_id))
@@ -0,0 +1,87 @@
+"""
+This module contains functions for snapshotting the testing database.
+
+The testing database lives in memory, so its state is copied to another
+in-memory database with the SQLite backup API. Restoring the snapshot
+copies the pages back, which is much cheaper than repeating the requests
+which prepared the state.
+The tests marked as `readonly` don't change the loaded snapshot, so it is
+loaded once for the tests following each other and dropped before the
+first test changing the database.
+
+Uses:
+-----
+- `typing` for type hinting.
+- `aiosqlite` for the connection keeping the snapshot.
+- `application.database.connection` for the testing engine.
+
+"""
+
+from typing import Dict, Optional
+
+import aiosqlite
+
+from application.database.connection import test_engine
+
+database_state: Dict[str, Optional[aiosqlite.Connection]] = {
+    "loaded_snapshot": None,
+}
+
+
+async def take_database_snapshot() -> aiosqlite.Connection:
+    """
+    Copy the current state of the testing database.
+
+    Returns:
+        aiosqlite.Connection: The connection to the in-memory database
+            keeping the copy. The caller is responsible for closing it.
+    """
+    snapshot: aiosqlite.Connection = await aiosqlite.connect(
+        ":memory:",
+        check_same_thread=False,
+    )
+    async with test_engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.backup(snapshot)  # type: ignore
+    return snapshot
+
+
+async def restore_database_snapshot(snapshot: aiosqlite.Connection) -> None:
+    """
+    Replace the content of the testing database with the snapshot.
+
+    Args:
+        snapshot (aiosqlite.Connection):
+            The connection returned by `take_database_snapshot`.
+    """
+    async with test_engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        await snapshot.backup(raw_connection.driver_connection)  # type: ignore
+
+
+async def load_database_snapshot(snapshot: aiosqlite.Connection) -> None:
+    """
+    Restore the snapshot unless the database already holds it.
+
+    Args:
+        snapshot (aiosqlite.Connection):
+            The connection returned by `take_database_snapshot`.
+    """
+    if database_state["loaded_snapshot"] is snapshot:
+        return
+    await restore_database_snapshot(snapshot=snapshot)
+    database_state["loaded_snapshot"] = snapshot
+
+
+def forget_loaded_snapshot() -> bool:
+    """
+    Forget the snapshot loaded for the read-only tests.
+
+    Returns:
+        bool: True if the database held a loaded snapshot.
+    """
+    loaded_snapshot: Optional[aiosqlite.Connection] = database_state[
+        "loaded_snapshot"
+    ]
+    database_state["loaded_snapshot"] = None
+    return loaded_snapshot is not None
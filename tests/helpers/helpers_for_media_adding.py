@@ -4,20 +4,73 @@ This module contains functions for preparing media content for testing.
 During testing, we need to prepare media content for upload.
 It essentially reads an image file and converts the content into bytes
 and additionally provides the filename and file type.
+The files never change during the test session, so each of them is read
+only once, and the content of the upload request is built once for each
+file and reused by the following calls. Reading is synchronous, so the
+helpers don't need the event loop. The files are resolved relative to
+the project root.
 
 Uses:
 -----
-- `aiofiles` for asynchronous file operations.
+- `functools` for caching of the read files.
+- `pathlib` for resolving the files relative to the project root.
 - `typing` for type hinting.
 
 """
 
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Tuple
 
-import aiofiles
+PROJECT_ROOT: Path = Path(__file__).resolve().parents[2]
+LOGO_PATH: str = str(PROJECT_ROOT / "twitter_clone_logo.jpg")
+WRONG_MEDIA_PATH: str = str(PROJECT_ROOT / "README.md")
 
 
-async def make_media_content() -> Dict[str, Tuple[str, bytes, str]]:
+@lru_cache(maxsize=None)
+def read_media_file(file_path: str) -> bytes:
+    """
+    Read a media file once and return its bytes' content.
+
+    Args:
+        file_path (str):
+            Path to file
+
+    Returns:
+        bytes: The content of the file.
+    """
+    with open(file_path, "rb") as file_object:
+        return file_object.read()
+
+
+@lru_cache(maxsize=None)
+def cache_media_content(
+    file_path: str, file_type: str,
+) -> Dict[str, Tuple[str, bytes, str]]:
+    """
+    Build the files of the upload request once for each file and type.
+
+    The content holds the bytes of the file, not an open file object,
+    so the same content can be posted any number of times.
+
+    Args:
+        file_path (str):
+            Path to file
+        file_type (str):
+            File type
+
+    Returns:
+        media_content (Dict[str, Tuple[str, bytes, str]]):
+            A dictionary containing name of file, corresponding byte
+            content and file type.
+    """
+    media_byte_str: bytes = read_media_file(file_path=file_path)
+    return {
+        "file": (file_path.split("/")[-1], media_byte_str, file_type),
+    }
+
+
+def make_media_content() -> Dict[str, Tuple[str, bytes, str]]:
     """
     Read an image file and return its bytes' content.
 
@@ -27,18 +80,10 @@ async def make_media_content() -> Dict[str, Tuple[str, bytes, str]]:
             corresponding byte content and file type.
 
     """
-    async with aiofiles.open(
-        "../../twitter_clone_logo.jpg",
-        "rb",
-    ) as file_object:
-        media_byte_str: bytes = await file_object.read()
-        media_content: Dict[str, Tuple[str, bytes, str]] = {
-            "file": ("twitter_clone_logo.jpg", media_byte_str, "image/jpeg"),
-        }
-    return media_content
-
-
-async def make_wrong_media_content(
+    return cache_media_content(file_path=LOGO_PATH, file_type="image/jpeg")
+
+
+def make_wrong_media_content(
     file_path: str, file_type: str,
 ) -> Dict[str, Tuple[str, bytes, str]]:
     """
@@ -57,12 +102,4 @@ async def make_wrong_media_content(
             A dictionary containing name of file, corresponding byte
             content and file type.
     """
-    async with aiofiles.open(
-        file_path,
-        "rb",
-    ) as file_object:
-        media_byte_str: bytes = await file_object.read()
-        media_content: Dict[str, Tuple[str, bytes, str]] = {
-            "file": (file_path.split("/")[-1], media_byte_str, file_type),
-        }
-    return media_content
+    return cache_media_content(file_path=file_path, file_type=file_type)
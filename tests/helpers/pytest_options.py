@@ -0,0 +1,112 @@
+"""
+This module is the pytest plugin configuring the testing session.
+
+It is registered by the `pytest_plugins` of the root conftest and keeps
+the hooks and fixtures which set up the session itself rather than the
+testing data.
+
+Uses:
+-----
+- `asyncio` and `sys` to run the tests in the uvloop event loop where
+    it is supported.
+- `typing` for type hinting.
+- `pytest` for the options and the fixtures of the plugin.
+- `pytest_asyncio` to run the async tests in the event loop of the
+    session.
+
+"""
+
+import asyncio
+import sys
+from typing import List, Optional, Set
+
+import pytest
+import pytest_asyncio
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """
+    Add the command line options of the testing session.
+
+    The `--fast-auth` option checks the rejection of each route by the
+    authentication with the first API key only, the other wrong API keys
+    of the route are skipped. The `--run-auth-smoke` option runs the
+    stable tests of the authentication, which are skipped by default.
+
+    Args:
+        parser (pytest.Parser): The parser of the command line options.
+    """
+    parser.addoption(
+        "--fast-auth",
+        action="store_true",
+        default=False,
+        help="check the rejection of each route by one wrong API key only",
+    )
+    parser.addoption(
+        "--run-auth-smoke",
+        action="store_true",
+        default=False,
+        help="run the tests marked as auth_smoke",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: List[pytest.Item],  # noqa: WPS110
+) -> None:
+    """
+    Run all the async tests in the event loop of the session.
+
+    The database is created once for the session, so the tests must share
+    its event loop with the session-scoped fixtures. The tests marked as
+    `auth_smoke` are skipped unless the `--run-auth-smoke` option is given.
+
+    Args:
+        config (pytest.Config): The configuration of the testing session.
+        items (List[pytest.Item]): The collected test items.
+    """
+    session_loop_marker = pytest.mark.asyncio(loop_scope="session")
+    auth_smoke_skip_marker = pytest.mark.skip(
+        reason="the auth smoke tests run with --run-auth-smoke",
+    )
+    run_auth_smoke: bool = config.getoption("--run-auth-smoke")
+    for test_item in items:
+        if pytest_asyncio.is_async_test(test_item):
+            test_item.add_marker(session_loop_marker, append=False)
+        if not run_auth_smoke and "auth_smoke" in test_item.keywords:
+            test_item.add_marker(auth_smoke_skip_marker)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """
+    Provide the policy of the event loops created by pytest-asyncio.
+
+    The uvloop policy is used where it is supported, so the session loop
+    is created by uvloop without changing the global policy at import.
+
+    Returns:
+        asyncio.AbstractEventLoopPolicy: The policy of the event loops.
+    """
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def verified_auth_routes(request) -> Optional[Set[str]]:
+    """
+    Keep the routes already rejected by the authentication.
+
+    Args:
+        request: The request of the testing session.
+
+    Returns:
+        Optional[Set[str]]: The set of the verified routes if the
+            `--fast-auth` option is given, else None.
+    """
+    if request.config.getoption("--fast-auth"):
+        return set()
+    return None
@@ -7,8 +7,8 @@ These constants are used across multiple testing modules.
 
 Variables:
 ----------
-TIMEOUT: timeout for the request.
-BASE_URL: base URL for the testing server.
+TIMEOUT: timeout for the request, built once as httpx timeout.
+BASE_URL: base URL of the requests to the in-process testing app.
 
 ADDED_STATUS_CODE: HTTP status code for successful post request.
 BAD_REQUEST_STATUS_CODE: HTTP status code for bad request.
@@ -19,10 +19,12 @@ SUCCESS_STATUS_CODE: HTTP status code for success response.
 SUCCESS_RESULT: boolean for successful operation.
 UNSUCCESSFUL_RESULT: boolean for unsuccessful operation.
 
-base_header: dictionary containing the api-key for testing user.
-wrong_header: dictionary containing the wrong api-key.
-base_header_for_the_second_user: dictionary containing the api-key for the
-second testing user.
+base_header: headers containing the api-key for testing user.
+wrong_header: headers containing the wrong api-key.
+base_header_for_the_second_user: headers containing the api-key
+for the second testing user.
+The headers are built once as httpx headers, so the client doesn't
+normalize them again for each request.
 
 TWEET_DATA_FIELD: field for tweet data.
 VALUE_OF_TWEET_DATA_FIELD: value for tweet data field for testing.
@@ -40,6 +42,7 @@ VALUE_OF_NAME_FIELD: value for user name.
 WRONG_VALUE_OF_NAME_FIELD: wrong value for user name.
 
 WRONG_MEDIA_ID: wrong id for media for testing.
+NEW_MEDIA_ID: placeholder replaced by the id of a media added for the test.
 USER_ID: user id for testing.
 NON_EXISTENT_USER_ID: non-existing user id for testing.
 TWEET_ID: tweet id for testing.
@@ -56,10 +59,38 @@ USER_INFO_ROUTE: endpoint to get info of the authenticated user.
 SUBSCRIPTION_ROUTE: endpoint to subscribe to a user.
 ROUTE_TO_LIKE_SPECIFIED_TWEET: endpoint to like a specified tweet.
 
+ROUTE_TO_USER_INFO: endpoint to get info of the testing user.
+ROUTE_TO_NON_EXISTENT_USER_INFO: endpoint to get info of a non-existent user.
+ROUTE_TO_USER_INFO_WITH_FORBIDDEN_SYMBOL: endpoint to get info of a user
+by the id with a forbidden symbol.
+ROUTE_TO_DELETE_NON_EXISTENT_TWEET: endpoint to delete a non-existent tweet.
+ROUTE_TO_DELETE_TWEET_WITH_FORBIDDEN_SYMBOL: endpoint to delete a tweet
+by the id with a forbidden symbol.
+ROUTE_TO_LIKE_NON_EXISTENT_TWEET: endpoint to like a non-existent tweet.
+ROUTE_TO_LIKE_TWEET_WITH_FORBIDDEN_SYMBOL: endpoint to like a tweet
+by the id with a forbidden symbol.
+ROUTE_TO_SUBSCRIBE_SECOND_USER: endpoint to subscribe to the second user.
+ROUTE_TO_SUBSCRIBE_NON_EXISTENT_USER: endpoint to subscribe to
+a non-existent user.
+ROUTE_TO_SUBSCRIBE_SELF: endpoint to subscribe to the testing user.
+ROUTE_TO_SUBSCRIBE_WITH_FORBIDDEN_SYMBOL: endpoint to subscribe to a user
+by the id with a forbidden symbol.
+
+The routes with the fixed IDs are built once on import, the helpers below
+are left for the IDs known only at runtime.
+
+Functions:
+----------
+make_tweet_route(tweet_id): endpoint of a specific tweet.
+make_like_route(tweet_id): endpoint to like a specific tweet.
+
 """
-from typing import Dict
+from functools import lru_cache
+from typing import Union
 
-TIMEOUT: int = 5
+from httpx import Headers, Timeout
+
+TIMEOUT: Timeout = Timeout(5)
 
 BASE_URL: str = "http://test_nginx"
 
@@ -72,9 +103,9 @@ SUCCESS_STATUS_CODE: int = 200
 SUCCESS_RESULT: bool = True
 UNSUCCESSFUL_RESULT: bool = False
 
-base_header: Dict[str, str] = {"api-key": "test"}
-wrong_header: Dict[str, str] = {"api-key": "wrong-test"}
-base_header_for_the_second_user: Dict[str, str] = {"api-key": "second-test"}
+base_header: Headers = Headers({"api-key": "test"})
+wrong_header: Headers = Headers({"api-key": "wrong-test"})
+base_header_for_the_second_user: Headers = Headers({"api-key": "second-test"})
 
 TWEET_DATA_FIELD: str = "tweet_data"
 VALUE_OF_TWEET_DATA_FIELD: str = "test_tweet_data"
@@ -92,6 +123,7 @@ VALUE_OF_NAME_FIELD: str = "random_user"
 WRONG_VALUE_OF_NAME_FIELD: int = 1111
 
 NONEXISTENT_MEDIA_ID: int = 1000
+NEW_MEDIA_ID: str = "new-media"
 USER_ID: int = 1
 SECOND_USER_ID: int = 2
 NON_EXISTENT_USER_ID: int = 1000
@@ -108,3 +140,61 @@ SPECIFIED_USER_INFO_ROUTE: str = "/api/users/{0}"
 USER_INFO_ROUTE: str = "/api/users/me"
 SUBSCRIPTION_ROUTE: str = "/api/users/{0}/follow"
 ROUTE_TO_LIKE_SPECIFIED_TWEET: str = "/api/tweets/{0}/likes"
+
+ROUTE_TO_USER_INFO: str = SPECIFIED_USER_INFO_ROUTE.format(USER_ID)
+ROUTE_TO_NON_EXISTENT_USER_INFO: str = SPECIFIED_USER_INFO_ROUTE.format(
+    NON_EXISTENT_USER_ID,
+)
+ROUTE_TO_USER_INFO_WITH_FORBIDDEN_SYMBOL: str = (
+    SPECIFIED_USER_INFO_ROUTE.format(FORBIDDEN_SYMBOL)
+)
+ROUTE_TO_DELETE_NON_EXISTENT_TWEET: str = ROUTE_TO_DELETE_TWEET.format(
+    NON_EXISTENT_TWEET_ID,
+)
+ROUTE_TO_DELETE_TWEET_WITH_FORBIDDEN_SYMBOL: str = (
+    ROUTE_TO_DELETE_TWEET.format(FORBIDDEN_SYMBOL)
+)
+ROUTE_TO_LIKE_NON_EXISTENT_TWEET: str = ROUTE_TO_LIKE_SPECIFIED_TWEET.format(
+    NON_EXISTENT_TWEET_ID,
+)
+ROUTE_TO_LIKE_TWEET_WITH_FORBIDDEN_SYMBOL: str = (
+    ROUTE_TO_LIKE_SPECIFIED_TWEET.format(FORBIDDEN_SYMBOL)
+)
+ROUTE_TO_SUBSCRIBE_SECOND_USER: str = SUBSCRIPTION_ROUTE.format(
+    SECOND_USER_ID,
+)
+ROUTE_TO_SUBSCRIBE_NON_EXISTENT_USER: str = SUBSCRIPTION_ROUTE.format(
+    NON_EXISTENT_USER_ID,
+)
+ROUTE_TO_SUBSCRIBE_SELF: str = SUBSCRIPTION_ROUTE.format(USER_ID)
+ROUTE_TO_SUBSCRIBE_WITH_FORBIDDEN_SYMBOL: str = SUBSCRIPTION_ROUTE.format(
+    FORBIDDEN_SYMBOL,
+)
+
+
+@lru_cache(maxsize=None)
+def make_tweet_route(tweet_id: Union[int, str]) -> str:
+    """
+    Make the endpoint of a specific tweet.
+
+    Args:
+        tweet_id (Union[int, str]): ID of the tweet.
+
+    Returns:
+        str: The endpoint to delete the tweet.
+    """
+    return ROUTE_TO_DELETE_TWEET.format(tweet_id)
+
+
+@lru_cache(maxsize=None)
+def make_like_route(tweet_id: Union[int, str]) -> str:
+    """
+    Make the endpoint to like a specific tweet.
+
+    Args:
+        tweet_id (Union[int, str]): ID of the tweet.
+
+    Returns:
+        str: The endpoint to like or unlike the tweet.
+    """
+    return ROUTE_TO_LIKE_SPECIFIED_TWEET.format(tweet_id)
@@ -17,19 +17,18 @@ Modules:
 import pytest_asyncio
 
 from tests.helpers.values import (
-    ROUTE_TO_LIKE_SPECIFIED_TWEET,
-    SECOND_USER_ID,
-    SUBSCRIPTION_ROUTE,
-    TIMEOUT,
+    ROUTE_TO_SUBSCRIBE_SECOND_USER,
     TWEET_DATA_FIELD,
     TWEETS_ROUTE,
     VALUE_OF_TWEET_DATA_FIELD,
-    base_header,
+    make_like_route,
 )
 
 
 @pytest_asyncio.fixture(scope="function")
-async def add_tweet_of_the_first_user_without_media(take_async_client) -> int:
+async def add_tweet_of_the_first_user_without_media(
+    take_first_user_client,
+) -> int:
     """
     Add a new tweet without any media by a user.
 
@@ -39,16 +38,14 @@ async def add_tweet_of_the_first_user_without_media(take_async_client) -> int:
     The fixture then returns the ID of the newly added tweet.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
 
     Returns:
         int: The ID of the newly added tweet.
     """
-    tweet_response = await take_async_client.post(
+    tweet_response = await take_first_user_client.post(
         url=TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
         json={
             TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD,
         },
@@ -58,7 +55,7 @@ async def add_tweet_of_the_first_user_without_media(take_async_client) -> int:
 
 @pytest_asyncio.fixture(scope="function")
 async def add_like_of_user_tweet(
-    take_async_client,
+    take_first_user_client,
     add_tweet_of_the_first_user_without_media,
 ) -> int:
     """
@@ -71,8 +68,8 @@ async def add_like_of_user_tweet(
      It then returns the same tweet ID after adding the like.
 
     Args:
-         take_async_client:
-             Asynchronous client to perform HTTP requests.
+         take_first_user_client:
+             Asynchronous client performing HTTP requests as the first user.
          add_tweet_of_the_first_user_without_media (int):
              Tweet ID generated from the fixture that creates a new tweet
              for the first user.
@@ -81,29 +78,22 @@ async def add_like_of_user_tweet(
          int: The ID of the liked tweet.
     """
     tweet_id: int = add_tweet_of_the_first_user_without_media
-    await take_async_client.post(
-        url=ROUTE_TO_LIKE_SPECIFIED_TWEET.format(tweet_id),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    await take_first_user_client.post(url=make_like_route(tweet_id))
     return tweet_id
 
 
 @pytest_asyncio.fixture(scope="function")
-async def subscribe_the_second_user(take_async_client) -> None:
+async def subscribe_the_second_user(
+    take_first_user_client,
+) -> None:
     """
     Subscribe a second user.
 
     This fixture sends a POST request to a specific subscription route.
-    It uses an async HTTP client and headers from the `tests.helpers.values`
-    module.
+    It uses the async HTTP client sending the API key of the first user.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    await take_async_client.post(
-        url=SUBSCRIPTION_ROUTE.format(SECOND_USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    await take_first_user_client.post(url=ROUTE_TO_SUBSCRIBE_SECOND_USER)
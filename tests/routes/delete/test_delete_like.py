@@ -10,31 +10,25 @@ for deletion contains forbidden symbols.
 
 Modules:
 --------
-- `pytest` to perform assertions for testing Python code.
 - `tests.helpers.assertation_checker` for ensuring response from the requests
     is as expected.
 - `tests.helpers.values` to use defined constants for requests.
 
 """
 
-import pytest
-
 from tests.helpers.assertation_checker import (
     negative_result_assertation_checker,
     positive_result_assertation_checker,
 )
 from tests.helpers.values import (
-    FORBIDDEN_SYMBOL,
-    NON_EXISTENT_TWEET_ID,
-    ROUTE_TO_LIKE_SPECIFIED_TWEET,
-    TIMEOUT,
-    base_header,
+    ROUTE_TO_LIKE_NON_EXISTENT_TWEET,
+    ROUTE_TO_LIKE_TWEET_WITH_FORBIDDEN_SYMBOL,
+    make_like_route,
 )
 
 
-@pytest.mark.asyncio
 async def test_can_delete_like_of_the_tweet(
-    take_async_client,
+    take_first_user_client,
     add_like_of_user_tweet,
 ) -> None:
     """
@@ -44,18 +38,16 @@ async def test_can_delete_like_of_the_tweet(
     and verify the result using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
         add_like_of_user_tweet (int):
             Tweet ID generated from the fixture that creates a new like
             for a tweet.
             This like will be deleted in the test.
     """
     liked_tweet: int = add_like_of_user_tweet
-    delete_like_response = await take_async_client.delete(
-        ROUTE_TO_LIKE_SPECIFIED_TWEET.format(liked_tweet),
-        timeout=TIMEOUT,
-        headers=base_header,
+    delete_like_response = await take_first_user_client.delete(
+        make_like_route(liked_tweet),
     )
     positive_result_assertation_checker(
         response=delete_like_response,
@@ -63,9 +55,8 @@ async def test_can_delete_like_of_the_tweet(
     )
 
 
-@pytest.mark.asyncio
 async def test_cannot_delete_like_of_nonexistent_tweet(
-    take_async_client,
+    take_first_user_client,
 ) -> None:
     """
     Check if a non-existent like of a tweet cannot be deleted.
@@ -74,13 +65,11 @@ async def test_cannot_delete_like_of_nonexistent_tweet(
     and verify the result using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    delete_like_response = await take_async_client.delete(
-        ROUTE_TO_LIKE_SPECIFIED_TWEET.format(NON_EXISTENT_TWEET_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
+    delete_like_response = await take_first_user_client.delete(
+        ROUTE_TO_LIKE_NON_EXISTENT_TWEET,
     )
     negative_result_assertation_checker(
         response=delete_like_response,
@@ -88,9 +77,8 @@ async def test_cannot_delete_like_of_nonexistent_tweet(
     )
 
 
-@pytest.mark.asyncio
 async def test_cannot_delete_like_of_the_wrong_tweet(
-    take_async_client,
+    take_first_user_client,
 ) -> None:
     """
     Check if the wrong or forbidden symbol like of a tweet cannot be deleted.
@@ -99,13 +87,11 @@ async def test_cannot_delete_like_of_the_wrong_tweet(
     forbidden symbols, and verify the result using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    delete_like_response = await take_async_client.delete(
-        ROUTE_TO_LIKE_SPECIFIED_TWEET.format(FORBIDDEN_SYMBOL),
-        timeout=TIMEOUT,
-        headers=base_header,
+    delete_like_response = await take_first_user_client.delete(
+        ROUTE_TO_LIKE_TWEET_WITH_FORBIDDEN_SYMBOL,
     )
     negative_result_assertation_checker(
         response=delete_like_response,
@@ -11,33 +11,26 @@ self-subscription deletions.
 
 Modules:
 --------
-- `pytest` to perform assertions for testing Python code.
 - `tests.helpers.assertation_checker` for ensuring response from the requests
     is as expected.
 - `tests.helpers.values` to use defined constants for requests.
 
 """
 
-import pytest
-
 from tests.helpers.assertation_checker import (
     negative_result_assertation_checker,
     positive_result_assertation_checker,
 )
 from tests.helpers.values import (
-    FORBIDDEN_SYMBOL,
-    NON_EXISTENT_USER_ID,
-    SECOND_USER_ID,
-    SUBSCRIPTION_ROUTE,
-    TIMEOUT,
-    USER_ID,
-    base_header,
+    ROUTE_TO_SUBSCRIBE_NON_EXISTENT_USER,
+    ROUTE_TO_SUBSCRIBE_SECOND_USER,
+    ROUTE_TO_SUBSCRIBE_SELF,
+    ROUTE_TO_SUBSCRIBE_WITH_FORBIDDEN_SYMBOL,
 )
 
 
-@pytest.mark.asyncio
 async def test_can_delete_user_subscription(
-    take_async_client,
+    take_first_user_client,
     subscribe_the_second_user,
 ) -> None:
     """
@@ -47,17 +40,15 @@ async def test_can_delete_user_subscription(
     and verify the result using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
         subscribe_the_second_user:
             The ID of the second user obtained from the fixture used for
             creating new user subscriptions.
             This subscription will be deleted in this test.
     """
-    delete_subscription_response = await take_async_client.delete(
-        SUBSCRIPTION_ROUTE.format(SECOND_USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
+    delete_subscription_response = await take_first_user_client.delete(
+        ROUTE_TO_SUBSCRIBE_SECOND_USER,
     )
     positive_result_assertation_checker(
         response=delete_subscription_response,
@@ -65,9 +56,8 @@ async def test_can_delete_user_subscription(
     )
 
 
-@pytest.mark.asyncio
 async def test_cannot_delete_nonexistent_subscription(
-    take_async_client,
+    take_first_user_client,
 ) -> None:
     """
     Check if a non-existent subscription cannot be deleted.
@@ -76,13 +66,11 @@ async def test_cannot_delete_nonexistent_subscription(
     and verify the result using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    delete_subscription_response = await take_async_client.delete(
-        SUBSCRIPTION_ROUTE.format(NON_EXISTENT_USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
+    delete_subscription_response = await take_first_user_client.delete(
+        ROUTE_TO_SUBSCRIBE_NON_EXISTENT_USER,
     )
     negative_result_assertation_checker(
         response=delete_subscription_response,
@@ -90,9 +78,8 @@ async def test_cannot_delete_nonexistent_subscription(
     )
 
 
-@pytest.mark.asyncio
 async def test_cannot_delete_self_subscription(
-    take_async_client,
+    take_first_user_client,
 ) -> None:
     """
     Verify unsuccessful attempts for deleting a self-subscription.
@@ -101,13 +88,11 @@ async def test_cannot_delete_self_subscription(
     and verify the result using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    delete_subscription_response = await take_async_client.delete(
-        SUBSCRIPTION_ROUTE.format(USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
+    delete_subscription_response = await take_first_user_client.delete(
+        ROUTE_TO_SUBSCRIBE_SELF,
     )
     negative_result_assertation_checker(
         response=delete_subscription_response,
@@ -115,9 +100,8 @@ async def test_cannot_delete_self_subscription(
     )
 
 
-@pytest.mark.asyncio
 async def test_cannot_delete_wrong_user_subscription(
-    take_async_client,
+    take_first_user_client,
 ) -> None:
     """
     Check if the subscription of a user with a wrong ID cannot be deleted.
@@ -127,13 +111,11 @@ async def test_cannot_delete_wrong_user_subscription(
     checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    delete_subscription_response = await take_async_client.delete(
-        SUBSCRIPTION_ROUTE.format(FORBIDDEN_SYMBOL),
-        timeout=TIMEOUT,
-        headers=base_header,
+    delete_subscription_response = await take_first_user_client.delete(
+        ROUTE_TO_SUBSCRIBE_WITH_FORBIDDEN_SYMBOL,
     )
     negative_result_assertation_checker(
         response=delete_subscription_response,
@@ -13,28 +13,34 @@ Modules:
 - `pytest` to perform assertions for testing Python code.
 - `tests.helpers.assertation_checker` for ensuring response from the
     requests is as expected.
+- `tests.helpers.case_types` for the type of the error cases.
 - `tests.helpers.values` to use defined constants for requests.
 
 """
 
+from typing import List
+
 import pytest
 
 from tests.helpers.assertation_checker import (
     negative_result_assertation_checker,
     positive_result_assertation_checker,
 )
+from tests.helpers.case_types import ErrorCase
 from tests.helpers.values import (
-    FORBIDDEN_SYMBOL,
-    NON_EXISTENT_TWEET_ID,
-    ROUTE_TO_DELETE_TWEET,
-    TIMEOUT,
-    base_header,
+    ROUTE_TO_DELETE_NON_EXISTENT_TWEET,
+    ROUTE_TO_DELETE_TWEET_WITH_FORBIDDEN_SYMBOL,
+    make_tweet_route,
 )
 
+wrong_tweet_routes: List[ErrorCase] = [
+    (ROUTE_TO_DELETE_NON_EXISTENT_TWEET, "bad request"),
+    (ROUTE_TO_DELETE_TWEET_WITH_FORBIDDEN_SYMBOL, "unprocessable entity"),
+]
+
 
-@pytest.mark.asyncio
 async def test_can_delete_specified_tweet(
-    take_async_client,
+    take_first_user_client,
     add_tweet_of_the_first_user_without_media,
 ) -> None:
     """
@@ -44,17 +50,15 @@ async def test_can_delete_specified_tweet(
     and verify the result using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
         add_tweet_of_the_first_user_without_media (int):
             Tweet ID generated from the fixture that creates a new tweet.
             This tweet will be deleted in the test.
     """
     tweet_id: int = add_tweet_of_the_first_user_without_media
-    delete_tweet_response = await take_async_client.delete(
-        ROUTE_TO_DELETE_TWEET.format(tweet_id),
-        timeout=TIMEOUT,
-        headers=base_header,
+    delete_tweet_response = await take_first_user_client.delete(
+        make_tweet_route(tweet_id),
     )
     positive_result_assertation_checker(
         response=delete_tweet_response,
@@ -62,49 +66,29 @@ async def test_can_delete_specified_tweet(
     )
 
 
-@pytest.mark.asyncio
-async def test_cannot_delete_nonexistent_tweet(take_async_client) -> None:
-    """
-    Check if a non-existent tweet cannot be deleted.
-
-    This test will try to delete a non-existent tweet,
-    and verify the result using assertation checker.
-
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-    """
-    delete_tweet_response = await take_async_client.delete(
-        ROUTE_TO_DELETE_TWEET.format(NON_EXISTENT_TWEET_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
-    negative_result_assertation_checker(
-        response=delete_tweet_response,
-        error_type="bad request",
-    )
-
-
-@pytest.mark.asyncio
-async def test_cannot_delete_tweet_with_wrong_symbol(
-    take_async_client,
+@pytest.mark.parametrize("route,error_type", wrong_tweet_routes)
+async def test_cannot_delete_tweet_by_wrong_id(
+    take_first_user_client,
+    route: str,
+    error_type: str,
 ) -> None:
     """
-    Check if the tweet with a wrong symbol cannot be deleted.
+    Check if a tweet cannot be deleted by a wrong ID.
 
-    This test will attempt to delete a tweet where tweet id contains
-    forbidden symbols, and verify the result using assertation checker.
+    This test will try to delete a non-existent tweet and a tweet where
+    tweet id contains forbidden symbols, and verify the result using
+    assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
+        route (str):
+            The route of the tweet with the wrong ID.
+        error_type (str):
+            The expected type of the error.
     """
-    delete_tweet_response = await take_async_client.delete(
-        ROUTE_TO_DELETE_TWEET.format(FORBIDDEN_SYMBOL),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    delete_tweet_response = await take_first_user_client.delete(route)
     negative_result_assertation_checker(
         response=delete_tweet_response,
-        error_type="unprocessable entity",
+        error_type=error_type,
     )
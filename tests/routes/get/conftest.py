@@ -1,111 +1,70 @@
 """
 This module contains fixtures to set up an environment for GET routes.
 
-This is done through the use of pytest fixtures, that once defined,
-can be reused throughout the project, significantly simplifying the
-setup and teardown of test environments.
-These fixtures can also rely on each other to further extend their
-functionality.
+The GET tests only read the data, so the data is prepared once per test
+session. The rows are inserted into the database directly, the users
+are added for the whole session by the root conftest. The state of the
+database is kept in a snapshot, which is restored instead of repeating
+the seeding.
+The GET tests are marked as `readonly`, so the restored data stays
+in the database for the following GET tests and is restored only once
+for the tests running one after another.
 
 Modules:
 --------
+- typing: For type hinting.
+- aiosqlite: For the type of the connection keeping the snapshot.
 - pytest_asyncio: Plugin for pytest to test asyncio code.
-- tests.helpers.helpers_for_media_adding: To provide media content for
-    the tests.
+- tests.helpers.database_seeding: To insert the rows of the tests.
+- tests.helpers.database_snapshot: To take and restore the snapshot of
+    the testing database.
 - tests.helpers.values: To use predefined constants.
 
 """
 
+from typing import AsyncGenerator
+
+import aiosqlite
 import pytest_asyncio
 
-from tests.helpers.helpers_for_media_adding import make_media_content
-from tests.helpers.values import (
-    MEDIAS_ROUTE,
-    ROUTE_TO_LIKE_SPECIFIED_TWEET,
-    SECOND_USER_ID,
-    SUBSCRIPTION_ROUTE,
-    TIMEOUT,
-    TWEET_DATA_FIELD,
-    TWEET_MEDIA_IDS_FIELD,
-    TWEETS_ROUTE,
-    USER_ID,
-    VALUE_OF_TWEET_DATA_FIELD,
-    base_header,
-    base_header_for_the_second_user,
+from tests.helpers.database_seeding import (
+    insert_like,
+    insert_mutual_subscriptions,
+    insert_tweet_with_media,
 )
+from tests.helpers.database_snapshot import (
+    load_database_snapshot,
+    take_database_snapshot,
+)
+from tests.helpers.values import SECOND_USER_ID, USER_ID
 
 
-@pytest_asyncio.fixture(scope="function", autouse=True)
-async def subscribe_users(take_async_client) -> None:
-    """
-    Create subscriptions between users.
-
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-    """
-    await take_async_client.post(
-        url=SUBSCRIPTION_ROUTE.format(SECOND_USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
-    await take_async_client.post(
-        url=SUBSCRIPTION_ROUTE.format(USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header_for_the_second_user,
-    )
-
-
-@pytest_asyncio.fixture(scope="function", autouse=True)
-async def add_tweet_of_the_second_user_with_media(take_async_client) -> int:
+@pytest_asyncio.fixture(scope="session")
+async def get_routes_snapshot() -> AsyncGenerator[aiosqlite.Connection, None]:
     """
-    Tweet a new media post.
+    Prepare the data of the GET tests and take the snapshot of it.
 
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+    The users subscribe to each other, the second user tweets a post with
+    media and the first user likes it.
 
-    Returns:
-        int: The ID of the created tweet.
+    Yields:
+        aiosqlite.Connection: The connection keeping the snapshot.
     """
-    media_response = await take_async_client.post(
-        url=MEDIAS_ROUTE,
-        files=await make_media_content(),
-        headers=base_header_for_the_second_user,
-        timeout=TIMEOUT,
-    )
-    media_id: int = media_response.json().get("media_id")
-    tweet_response = await take_async_client.post(
-        url=TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header_for_the_second_user,
-        json={
-            TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD,
-            TWEET_MEDIA_IDS_FIELD: [media_id],
-        },
-    )
-    return tweet_response.json().get("tweet_id")
+    await insert_mutual_subscriptions(USER_ID, SECOND_USER_ID)
+    tweet_id: int = await insert_tweet_with_media(user_id=SECOND_USER_ID)
+    await insert_like(user_id=USER_ID, tweet_id=tweet_id)
+    snapshot: aiosqlite.Connection = await take_database_snapshot()
+    yield snapshot
+    await snapshot.close()
 
 
-@pytest_asyncio.fixture(scope="function", autouse=True)
-async def add_like_of_the_tweet_of_the_second_user(
-    take_async_client,
-    add_tweet_of_the_second_user_with_media,
-) -> None:
+@pytest_asyncio.fixture(scope="function")
+async def restore_get_routes_data(get_routes_snapshot) -> None:
     """
-    Like a tweeted media post.
+    Restore the data of the GET tests unless the database holds it.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-        add_tweet_of_the_second_user_with_media (int):
-            Tweet ID generated from the fixture that creates a new tweet
-            with media.
-            This tweet will be liked in the test.
+        get_routes_snapshot (aiosqlite.Connection):
+            The connection keeping the snapshot.
     """
-    tweet_id: int = add_tweet_of_the_second_user_with_media
-    await take_async_client.post(
-        url=ROUTE_TO_LIKE_SPECIFIED_TWEET.format(tweet_id),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    await load_database_snapshot(snapshot=get_routes_snapshot)
@@ -14,6 +14,7 @@ Modules:
 - pytest: to perform assertions for testing Python code.
 - tests.helpers.assertation_checker: for ensuring response from the
     requests is as expected.
+- tests.helpers.case_types: for the type of the error cases.
 - tests.helpers.values: to use defined constants for requests.
 
 """
@@ -27,27 +28,34 @@ from tests.helpers.assertation_checker import (
     user_info_assertation_checker,
     user_tweets_assertation_checker,
 )
+from tests.helpers.case_types import ErrorCase
 from tests.helpers.values import (
-    FORBIDDEN_SYMBOL,
-    NON_EXISTENT_USER_ID,
-    SPECIFIED_USER_INFO_ROUTE,
-    TIMEOUT,
+    ROUTE_TO_NON_EXISTENT_USER_INFO,
+    ROUTE_TO_USER_INFO,
+    ROUTE_TO_USER_INFO_WITH_FORBIDDEN_SYMBOL,
     TWEETS_ROUTE,
-    USER_ID,
     USER_INFO_ROUTE,
-    base_header,
 )
 
 test_data: List[str] = [
-    SPECIFIED_USER_INFO_ROUTE.format(USER_ID),
+    ROUTE_TO_USER_INFO,
     USER_INFO_ROUTE,
 ]
 
+wrong_user_routes: List[ErrorCase] = [
+    (ROUTE_TO_NON_EXISTENT_USER_INFO, "bad request"),
+    (ROUTE_TO_USER_INFO_WITH_FORBIDDEN_SYMBOL, "unprocessable entity"),
+]
+
+pytestmark = [
+    pytest.mark.readonly,
+    pytest.mark.usefixtures("restore_get_routes_data"),
+]
+
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("route", test_data)
 async def test_can_get_current_user_and_user_by_id(
-    take_async_client,
+    take_first_user_client,
     route: str,
 ) -> None:
     """
@@ -57,70 +65,44 @@ async def test_can_get_current_user_and_user_by_id(
     user, and verify the result using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
         route (str):
             The url route used to perform the GET request.
     """
-    response = await take_async_client.get(
-        url=route,
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    response = await take_first_user_client.get(url=route)
     user_info_assertation_checker(response=response)
 
 
-@pytest.mark.asyncio
-async def test_cannot_get_non_existent_user(take_async_client) -> None:
-    """
-    Check if a non-existent user cannot be gotten.
-
-    This test will try to get info of a non-existent user,
-    and verify the result using assertation checker.
-
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-    """
-    response = await take_async_client.get(
-        url=SPECIFIED_USER_INFO_ROUTE.format(NON_EXISTENT_USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
-    negative_result_assertation_checker(
-        response=response,
-        error_type="bad request",
-    )
-
-
-@pytest.mark.asyncio
-async def test_cannot_get_user_with_wrong_id(
-    take_async_client,
+@pytest.mark.parametrize("route,error_type", wrong_user_routes)
+async def test_cannot_get_user_by_wrong_id(
+    take_first_user_client,
+    route: str,
+    error_type: str,
 ) -> None:
     """
-    Check if the user with a wrong id cannot be gotten.
+    Check if the user cannot be gotten by a wrong id.
 
-    This test will get info of user with id contains
-    forbidden symbols, and verify the result using
+    This test will try to get info of a non-existent user and of a user
+    with id contains forbidden symbols, and verify the result using
     assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
+        route (str):
+            The route of the user with the wrong ID.
+        error_type (str):
+            The expected type of the error.
     """
-    response = await take_async_client.get(
-        url=SPECIFIED_USER_INFO_ROUTE.format(FORBIDDEN_SYMBOL),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    response = await take_first_user_client.get(url=route)
     negative_result_assertation_checker(
         response=response,
-        error_type="unprocessable entity",
+        error_type=error_type,
     )
 
 
-@pytest.mark.asyncio
-async def test_can_get_tweets_of_current_user(take_async_client) -> None:
+async def test_can_get_tweets_of_current_user(take_first_user_client) -> None:
     """
     Check if tweets of the current user can be gotten.
 
@@ -128,12 +110,8 @@ async def test_can_get_tweets_of_current_user(take_async_client) -> None:
     using assertation checker.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    response = await take_async_client.get(
-        TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    response = await take_first_user_client.get(TWEETS_ROUTE)
     user_tweets_assertation_checker(response=response)
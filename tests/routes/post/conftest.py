@@ -2,72 +2,64 @@
 This module contains async pytest fixtures for tweet-related testing.
 
 These fixtures facilitate efficient setup and teardown processes for tests.
+The rows are inserted into the database directly, the routes adding them
+are covered by their own tests.
 
 Imports:
 --------
+- typing: For type hinting.
 - pytest_asyncio: For asynchronous interaction with pytest.
-- tests.helpers.helpers_for_media_adding: For generating media content needed
+- tests.helpers.database_seeding: For inserting the rows needed
     for the tests.
 - tests.helpers.values: To use defined constants for the tests.
 
 """
 
+from typing import List
+
 import pytest_asyncio
 
-from tests.helpers.helpers_for_media_adding import make_media_content
-from tests.helpers.values import (
-    MEDIAS_ROUTE,
-    TIMEOUT,
-    TWEET_DATA_FIELD,
-    TWEETS_ROUTE,
-    VALUE_OF_TWEET_DATA_FIELD,
-    base_header,
-    base_header_for_the_second_user,
-)
+from tests.helpers.database_seeding import insert_media, insert_tweet
+from tests.helpers.values import NEW_MEDIA_ID, SECOND_USER_ID
 
 
 @pytest_asyncio.fixture(scope="function")
-async def add_new_media_for_the_tweet_of_the_first_user(
-    take_async_client,
-) -> int:
+async def add_new_media_for_the_tweet_of_the_first_user() -> int:
     """
-    Post a new media and return its id.
+    Insert a new media and return its id.
 
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+    Returns:
+        int: The ID of the inserted media.
+    """
+    return await insert_media()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def add_tweet_of_the_second_user_without_media() -> int:
+    """
+    Insert a new tweet without media and return its id.
 
     Returns:
-        int: The ID of the posted media.
+        int: The ID of the inserted tweet.
     """
-    response = await take_async_client.post(
-        url=MEDIAS_ROUTE,
-        files=await make_media_content(),
-        headers=base_header,
-        timeout=TIMEOUT,
-    )
-    response_data = response.json()
-    return response_data.get("media_id")
-
-
-@pytest_asyncio.fixture(scope="function", autouse=True)
-async def add_tweet_of_the_second_user_without_media(take_async_client) -> int:
+    return await insert_tweet(user_id=SECOND_USER_ID)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def media_ids(request) -> List[int]:
     """
-    Post a new tweet without media and return its id.
+    Make the media IDs of a tweet from the indirect parameter.
+
+    Each NEW_MEDIA_ID placeholder is replaced by the ID of a media inserted
+    for the test, so only the cases using it pay for the insert.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        request: The request holding the media IDs as its parameter.
 
     Returns:
-        int: The ID of the posted tweet.
+        List[int]: The media IDs of the tweet.
     """
-    tweet_response = await take_async_client.post(
-        url=TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header_for_the_second_user,
-        json={
-            TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD,
-        },
-    )
-    return tweet_response.json().get("tweet_id")
+    return [
+        await insert_media() if media_id == NEW_MEDIA_ID else media_id
+        for media_id in request.param
+    ]
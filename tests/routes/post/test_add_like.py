@@ -6,85 +6,70 @@ Modules:
 - pytest:  To perform assertions for testing Python code.
 - tests.helpers.assertation_checker:  For ensuring response from the requests
     is as expected.
+- tests.helpers.case_types:  For the type of the error cases.
 - tests.helpers.values: To use predefined constants for requests.
 
 """
 
+from typing import List
+
 import pytest
 
 from tests.helpers.assertation_checker import (
     negative_result_assertation_checker,
     positive_result_assertation_checker,
 )
+from tests.helpers.case_types import ErrorCase
 from tests.helpers.values import (
-    FORBIDDEN_SYMBOL,
-    NON_EXISTENT_TWEET_ID,
-    ROUTE_TO_LIKE_SPECIFIED_TWEET,
-    TIMEOUT,
-    base_header,
+    ROUTE_TO_LIKE_NON_EXISTENT_TWEET,
+    ROUTE_TO_LIKE_TWEET_WITH_FORBIDDEN_SYMBOL,
+    make_like_route,
 )
 
+wrong_like_routes: List[ErrorCase] = [
+    (ROUTE_TO_LIKE_NON_EXISTENT_TWEET, "bad request"),
+    (ROUTE_TO_LIKE_TWEET_WITH_FORBIDDEN_SYMBOL, "unprocessable entity"),
+]
+
 
-@pytest.mark.asyncio
 async def test_can_add_like_of_the_tweet(
-    take_async_client,
+    take_first_user_client,
     add_tweet_of_the_second_user_without_media,
 ) -> None:
     """
     Check whether user can like a tweet.
 
     Args:
-        take_async_client:
-            Async test client.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
         add_tweet_of_the_second_user_without_media:
             Fixture that creates a tweet by the second user.
     """
     tweet_id: int = add_tweet_of_the_second_user_without_media
-    like_response = await take_async_client.post(
-        url=ROUTE_TO_LIKE_SPECIFIED_TWEET.format(tweet_id),
-        timeout=TIMEOUT,
-        headers=base_header,
+    like_response = await take_first_user_client.post(
+        url=make_like_route(tweet_id),
     )
     positive_result_assertation_checker(response=like_response)
 
 
-@pytest.mark.asyncio
-async def test_cannot_add_like_of_the_nonexistent_tweet(
-    take_async_client,
+@pytest.mark.parametrize("route,error_type", wrong_like_routes)
+async def test_cannot_add_like_by_wrong_tweet_id(
+    take_first_user_client,
+    route: str,
+    error_type: str,
 ) -> None:
     """
-    Check whether user cannot like a non-existent tweet.
+    Check whether user cannot like a tweet by a wrong ID.
 
-    Args:
-        take_async_client: Async test client.
-    """
-    like_response = await take_async_client.post(
-        url=ROUTE_TO_LIKE_SPECIFIED_TWEET.format(NON_EXISTENT_TWEET_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
-    negative_result_assertation_checker(
-        response=like_response,
-        error_type="bad request",
-    )
-
-
-@pytest.mark.asyncio
-async def test_cannot_add_like_with_wrong_symbol(
-    take_async_client,
-) -> None:
-    """
-    Check whether user cannot use a wrong symbol in the like request.
+    The ID is either of a non-existent tweet or contains a wrong symbol.
 
     Args:
-        take_async_client: Async test client.
+        take_first_user_client: Async test client.
+        route (str): The like route of the tweet with the wrong ID.
+        error_type (str): The expected type of the error.
     """
-    like_response = await take_async_client.post(
-        url=ROUTE_TO_LIKE_SPECIFIED_TWEET.format(FORBIDDEN_SYMBOL),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    like_response = await take_first_user_client.post(url=route)
     negative_result_assertation_checker(
         response=like_response,
-        error_type="unprocessable entity",
+        error_type=error_type,
     )
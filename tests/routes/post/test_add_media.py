@@ -3,43 +3,34 @@ This module contains async tests for media upload functionality.
 
 Imports:
 --------
-- pytest: For creating unit tests.
 - tests.helpers.assertation_checker: For checking the server's responses.
-- tests.helpers.helpers_for_media_adding: Provides helper functions for
-    preparing media data.
 - tests.helpers.values: To use predefined constants.
 
 """
 
-import pytest
-
 from tests.helpers.assertation_checker import (
     negative_result_assertation_checker,
     positive_result_assertation_checker,
 )
-from tests.helpers.helpers_for_media_adding import (
-    make_media_content,
-    make_wrong_media_content,
-)
-from tests.helpers.values import MEDIAS_ROUTE, TIMEOUT, base_header
+from tests.helpers.values import MEDIAS_ROUTE
 
 
-@pytest.mark.asyncio
 async def test_can_add_media(
-    take_async_client,
+    take_first_user_client,
+    cached_media_content,
 ) -> None:
     """
     Check a possibility to upload a correct media file.
 
      Args:
-         take_async_client:
-             Asynchronous client to perform HTTP requests.
+         take_first_user_client:
+             Asynchronous client performing HTTP requests as the first user.
+         cached_media_content:
+             The files of the upload request prepared once per session.
     """
-    media_response = await take_async_client.post(
+    media_response = await take_first_user_client.post(
         url=MEDIAS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
-        files=await make_media_content(),
+        files=cached_media_content,
     )
     positive_result_assertation_checker(
         response=media_response,
@@ -47,25 +38,22 @@ async def test_can_add_media(
     )
 
 
-@pytest.mark.asyncio
 async def test_cannot_add_wrong_media(
-    take_async_client,
+    take_first_user_client,
+    wrong_media_content,
 ) -> None:
     """
     Check a possibility to upload a wrong media file.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
+        wrong_media_content:
+            The files of the upload request with a non-image file.
     """
-    media_response = await take_async_client.post(
+    media_response = await take_first_user_client.post(
         url=MEDIAS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
-        files=await make_wrong_media_content(
-            file_path="../../../README.md",
-            file_type="text/markdown",
-        ),
+        files=wrong_media_content,
     )
     negative_result_assertation_checker(
         response=media_response,
@@ -73,22 +61,17 @@ async def test_cannot_add_wrong_media(
     )
 
 
-@pytest.mark.asyncio
 async def test_cannot_add_empty_media(
-    take_async_client,
+    take_first_user_client,
 ) -> None:
     """
     Check whether an empty media file cannot be uploaded.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    media_response = await take_async_client.post(
-        url=MEDIAS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    media_response = await take_first_user_client.post(url=MEDIAS_ROUTE)
     negative_result_assertation_checker(
         response=media_response,
         error_type="unprocessable entity",
@@ -6,42 +6,45 @@ Imports:
 - pytest: For creating unit tests.
 - tests.helpers.assertation_checker: For checking the server's
     responses.
+- tests.helpers.case_types: For the type of the media IDs.
 - tests.helpers.values: To use predefined constants.
 
 """
 
+from typing import List
+
 import pytest
 
 from tests.helpers.assertation_checker import (
     negative_result_assertation_checker,
     positive_result_assertation_checker,
 )
+from tests.helpers.case_types import MediaIds
 from tests.helpers.values import (
-    FORBIDDEN_SYMBOL,
+    NEW_MEDIA_ID,
     NONEXISTENT_MEDIA_ID,
-    TIMEOUT,
     TWEET_DATA_FIELD,
     TWEET_MEDIA_IDS_FIELD,
     TWEETS_ROUTE,
     VALUE_OF_TWEET_DATA_FIELD,
-    WRONG_VALUE_OF_TWEET_DATA_FIELD,
-    base_header,
 )
 
+nonexistent_media_ids: List[MediaIds] = [
+    [NONEXISTENT_MEDIA_ID],
+    [NEW_MEDIA_ID, NONEXISTENT_MEDIA_ID],
+]
+
 
-@pytest.mark.asyncio
-async def test_can_add_tweet_without_media(take_async_client) -> None:
+async def test_can_add_tweet_without_media(take_first_user_client) -> None:
     """
     Check a possibility to add a tweet without media.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    response = await take_async_client.post(
+    response = await take_first_user_client.post(
         TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
         json={TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD},
     )
     positive_result_assertation_checker(
@@ -50,25 +53,22 @@ async def test_can_add_tweet_without_media(take_async_client) -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_can_add_tweet_with_media(
-    take_async_client,
+    take_first_user_client,
     add_new_media_for_the_tweet_of_the_first_user,
 ) -> None:
     """
     Check a possibility to add a tweet with media.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
         add_new_media_for_the_tweet_of_the_first_user:
             Fixture for adding new media for a tweet.
     """
     media_id: int = add_new_media_for_the_tweet_of_the_first_user
-    tweet_response = await take_async_client.post(
+    tweet_response = await take_first_user_client.post(
         url=TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
         json={
             TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD,
             TWEET_MEDIA_IDS_FIELD: [media_id],
@@ -80,129 +80,52 @@ async def test_can_add_tweet_with_media(
     )
 
 
-@pytest.mark.asyncio
-async def test_cannot_add_tweet_without_data(take_async_client) -> None:
+async def test_cannot_add_tweet_without_data(take_first_user_client) -> None:
     """
     Check an impossibility to add a tweet without any data.
 
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-    """
-    response = await take_async_client.post(
-        url=TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
-    negative_result_assertation_checker(
-        response=response,
-        error_type="unprocessable entity",
-    )
-
-
-@pytest.mark.asyncio
-async def test_cannot_add_tweet_with_wrong_data(take_async_client) -> None:
-    """
-    Check an impossibility to add a tweet with the wrong data.
+    The wrong bodies are checked by the tests of the request schemas,
+    this test covers the response to the rejected request.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    response = await take_async_client.post(
-        url=TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
-        json={
-            TWEET_DATA_FIELD: WRONG_VALUE_OF_TWEET_DATA_FIELD,
-        },
-    )
+    response = await take_first_user_client.post(url=TWEETS_ROUTE)
     negative_result_assertation_checker(
         response=response,
         error_type="unprocessable entity",
     )
 
 
-@pytest.mark.asyncio
-async def test_cannot_add_tweet_with_nonexistent_media_ids(  # noqa: WPS118
-    take_async_client,
+@pytest.mark.parametrize(
+    "media_ids",
+    nonexistent_media_ids,
+    indirect=["media_ids"],
+)
+async def test_cannot_add_tweet_with_bad_media_ids(
+    take_first_user_client,
+    media_ids: List[int],
 ) -> None:
     """
-    Check an impossibility to add a tweet with all nonexistent media ids.
-
-     Args:
-         take_async_client: Asynchronous client to perform HTTP requests.
-    """
-    response = await take_async_client.post(
-        TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
-        json={
-            TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD,
-            TWEET_MEDIA_IDS_FIELD: [NONEXISTENT_MEDIA_ID],
-        },
-    )
-    negative_result_assertation_checker(
-        response=response,
-        error_type="bad request",
-    )
+    Check an impossibility to add a tweet with nonexistent media IDs.
 
-
-@pytest.mark.asyncio
-async def test_cannot_add_tweet_with_one_nonexistent_media_id(  # noqa: WPS118
-    take_async_client,
-    add_new_media_for_the_tweet_of_the_first_user,
-) -> None:
-    """
-    Check an impossibility to add a tweet with one nonexistent media ID.
+    All the media IDs or one of them don't exist.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-        add_new_media_for_the_tweet_of_the_first_user:
-            Fixture for adding new media for the tweet.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
+        media_ids (List[int]):
+            The media IDs of the tweet.
     """
-    media_id: int = add_new_media_for_the_tweet_of_the_first_user
-    response = await take_async_client.post(
+    response = await take_first_user_client.post(
         TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
         json={
             TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD,
-            TWEET_MEDIA_IDS_FIELD: [media_id, NONEXISTENT_MEDIA_ID],
+            TWEET_MEDIA_IDS_FIELD: media_ids,
         },
     )
     negative_result_assertation_checker(
         response=response,
         error_type="bad request",
     )
-
-
-@pytest.mark.asyncio
-async def test_cannot_add_tweet_with_wrong_media_id(
-    take_async_client,
-    add_new_media_for_the_tweet_of_the_first_user,
-) -> None:
-    """
-    Check an impossibility to add a tweet with a wrong media ID.
-
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-        add_new_media_for_the_tweet_of_the_first_user:
-            Fixture for adding new media for the tweet.
-    """
-    media_id: int = add_new_media_for_the_tweet_of_the_first_user
-    response = await take_async_client.post(
-        TWEETS_ROUTE,
-        timeout=TIMEOUT,
-        headers=base_header,
-        json={
-            TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD,
-            TWEET_MEDIA_IDS_FIELD: [FORBIDDEN_SYMBOL, media_id],
-        },
-    )
-    negative_result_assertation_checker(
-        response=response,
-        error_type="unprocessable entity",
-    )
@@ -7,101 +7,70 @@ Imports:
     simple tests.
 - tests.helpers.assertion_checker: Contains helper functions to
     check assertions.
+- tests.helpers.case_types: For the type of the error cases.
 - tests.helpers.values: Predefined constants used in requests.
 
 """
 
+from typing import List
+
 import pytest
 
 from tests.helpers.assertation_checker import (
     negative_result_assertation_checker,
     positive_result_assertation_checker,
 )
+from tests.helpers.case_types import ErrorCase
 from tests.helpers.values import (
-    FORBIDDEN_SYMBOL,
-    NON_EXISTENT_USER_ID,
-    SECOND_USER_ID,
-    SUBSCRIPTION_ROUTE,
-    TIMEOUT,
-    USER_ID,
-    base_header,
+    ROUTE_TO_SUBSCRIBE_NON_EXISTENT_USER,
+    ROUTE_TO_SUBSCRIBE_SECOND_USER,
+    ROUTE_TO_SUBSCRIBE_SELF,
+    ROUTE_TO_SUBSCRIBE_WITH_FORBIDDEN_SYMBOL,
 )
 
+wrong_subscription_routes: List[ErrorCase] = [
+    (ROUTE_TO_SUBSCRIBE_NON_EXISTENT_USER, "bad request"),
+    (ROUTE_TO_SUBSCRIBE_SELF, "bad request"),
+    (ROUTE_TO_SUBSCRIBE_WITH_FORBIDDEN_SYMBOL, "unprocessable entity"),
+]
+
 
-@pytest.mark.asyncio
-async def can_subscribe_user(take_async_client) -> None:
+async def test_can_subscribe_user(take_first_user_client) -> None:
     """
     Test the functionality of a user subscribing to another user's posts.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
     """
-    subscription_response = await take_async_client.post(
-        url=SUBSCRIPTION_ROUTE.format(SECOND_USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
+    subscription_response = await take_first_user_client.post(
+        url=ROUTE_TO_SUBSCRIBE_SECOND_USER,
     )
     positive_result_assertation_checker(response=subscription_response)
 
 
-@pytest.mark.asyncio
-async def cannot_subscribe_nonexistent_user(take_async_client) -> None:
-    """
-    Test handling of an attempt to subscribe to a non-existent user.
-
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-    """
-    subscription_response = await take_async_client.post(
-        url=SUBSCRIPTION_ROUTE.format(NON_EXISTENT_USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
-    negative_result_assertation_checker(
-        response=subscription_response,
-        error_type="bad request",
-    )
-
-
-@pytest.mark.asyncio
-async def cannot_get_self_subscription(take_async_client) -> None:
-    """
-    Test the constrains of a user trying to subscribe to their own posts.
-
-    Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
-    """
-    subscription_response = await take_async_client.post(
-        url=SUBSCRIPTION_ROUTE.format(USER_ID),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
-    negative_result_assertation_checker(
-        response=subscription_response,
-        error_type="bad request",
-    )
-
-
-@pytest.mark.asyncio
-async def cannot_subscribe_user_with_forbidden_symbol(
-    take_async_client,
+@pytest.mark.parametrize("route,error_type", wrong_subscription_routes)
+async def test_cannot_subscribe_user_by_wrong_id(
+    take_first_user_client,
+    route: str,
+    error_type: str,
 ) -> None:
     """
-    Test error handling when the symbols used for subscription are forbidden.
+    Test handling of an attempt to subscribe to a user by a wrong ID.
+
+    The ID is of a non-existent user, of the current user or contains
+    forbidden symbols.
 
     Args:
-        take_async_client:
-            Asynchronous client to perform HTTP requests.
+        take_first_user_client:
+            Asynchronous client performing HTTP requests as the first user.
+        route (str):
+            The subscription route of the user with the wrong ID.
+        error_type (str):
+            The expected type of the error.
     """
-    subscription_response = await take_async_client.post(
-        url=SUBSCRIPTION_ROUTE.format(FORBIDDEN_SYMBOL),
-        timeout=TIMEOUT,
-        headers=base_header,
-    )
+    subscription_response = await take_first_user_client.post(url=route)
     negative_result_assertation_checker(
         response=subscription_response,
-        error_type="unprocessable entity",
+        error_type=error_type,
     )
@@ -0,0 +1,97 @@
+"""
+This module contains tests for the validation of the request bodies.
+
+The wrong request bodies are rejected by the Pydantic models before the
+routes touch the database, so the models are checked directly instead of
+sending the requests. The error responses of the rejected requests are
+covered by the tests of the routes. The tests don't change the database,
+so they are marked as `readonly`.
+
+Modules:
+--------
+- typing: For type hinting.
+- pydantic: For the error raised by the failed validation.
+- pytest: For creating unit tests.
+- application.schemas: For the models of the request bodies.
+- tests.helpers.case_types: For the type of the request bodies.
+- tests.helpers.values: To use predefined constants.
+
+"""
+
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from application.schemas.tweet_schemas import TweetRequest
+from application.schemas.user_schemas import UserRequest
+from tests.helpers.case_types import RequestBody
+from tests.helpers.values import (
+    FORBIDDEN_SYMBOL,
+    NAME_FIELD,
+    NONEXISTENT_MEDIA_ID,
+    TESTING_API_KEY_FIELD,
+    TWEET_DATA_FIELD,
+    TWEET_MEDIA_IDS_FIELD,
+    VALUE_OF_NAME_FIELD,
+    VALUE_OF_TESTING_API_KEY_FIELD,
+    VALUE_OF_TWEET_DATA_FIELD,
+    WRONG_VALUE_OF_NAME_FIELD,
+    WRONG_VALUE_OF_TESTING_API_KEY_FIELD,
+    WRONG_VALUE_OF_TWEET_DATA_FIELD,
+)
+
+wrong_users_data: List[RequestBody] = [
+    {TESTING_API_KEY_FIELD: VALUE_OF_TESTING_API_KEY_FIELD},
+    {
+        TESTING_API_KEY_FIELD: VALUE_OF_TESTING_API_KEY_FIELD,
+        NAME_FIELD: WRONG_VALUE_OF_NAME_FIELD,
+    },
+    {NAME_FIELD: VALUE_OF_NAME_FIELD},
+    {
+        TESTING_API_KEY_FIELD: WRONG_VALUE_OF_TESTING_API_KEY_FIELD,
+        NAME_FIELD: VALUE_OF_NAME_FIELD,
+    },
+]
+
+wrong_tweets_data: List[RequestBody] = [
+    {},
+    {TWEET_DATA_FIELD: WRONG_VALUE_OF_TWEET_DATA_FIELD},
+    {
+        TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD,
+        TWEET_MEDIA_IDS_FIELD: [FORBIDDEN_SYMBOL, NONEXISTENT_MEDIA_ID],
+    },
+]
+
+pytestmark = pytest.mark.readonly
+
+
+@pytest.mark.parametrize("user_data", wrong_users_data)
+def test_cannot_validate_wrong_user_data(user_data: RequestBody) -> None:
+    """
+    Check an impossibility to validate the wrong data of a new user.
+
+    The name or the API key is either missing or has a wrong type.
+
+    Args:
+        user_data (RequestBody):
+            The JSON body of the request.
+    """
+    with pytest.raises(ValidationError):
+        UserRequest.model_validate(user_data)
+
+
+@pytest.mark.parametrize("tweet_data", wrong_tweets_data)
+def test_cannot_validate_wrong_tweet_data(tweet_data: RequestBody) -> None:
+    """
+    Check an impossibility to validate the wrong data of a new tweet.
+
+    The data is either missing or has a wrong type, or a media ID
+    contains a forbidden symbol.
+
+    Args:
+        tweet_data (RequestBody):
+            The JSON body of the request.
+    """
+    with pytest.raises(ValidationError):
+        TweetRequest.model_validate(tweet_data)
@@ -10,271 +10,203 @@ verify that:
 
 It calls utilities from `tests.helpers`, and uses test data to
 iterate through each route.
-Test data for GET, POST and DELETE requests are stored in
-`test_data_for_get_routes`, `test_data_for_post_routes` and
-`test_data_for_delete_routes` respectively.
+The routes requested by GET, POST and DELETE are stored in
+`test_data_for_authenticated_routes` under short stable ids, which keep
+the node ids compact and the `--lf` cache deterministic. The routes are
+formatted with the IDs of the testing data, the same as in the requests
+of the routes. The requests are denied by the authentication before the
+routing, so the authentication is called directly for each route with
+the missing and the wrong API key, and the requests of each HTTP method
+with the missing and with the wrong API key go through the whole
+application.
+The tests don't change the database, so they are marked as `readonly`
+at the module level, and the asyncio mode of the session runs them
+without a mark of their own. The direct calls of the authentication are
+also marked as `auth_smoke`, so they run only with the `--run-auth-smoke`
+option, while the requests through the application always run.
 
 Modules:
 --------
 typing: For collection typecasting, and to provide hints for functions
 pytest: The testing framework being used
+fastapi: For the error raised by the failed authentication
+orjson: For serializing the body of the request once
+httpx: For the headers of the requests
+application.middlewares.api_key_authentication: For the authentication
+of the requests
 tests.helpers.assertation_checker: For validating responses
-tests.helpers.helpers_for_media_adding: To help create media content
-for testing
+tests.helpers.case_types: For the type of the tables of the test cases
 tests.helpers.values: Contains route and key-value pairs of data
 
 """
-from typing import List
+from typing import Optional, Set
 
+import orjson
 import pytest
+from fastapi import HTTPException
+from httpx import Headers
 
+from application.middlewares.api_key_authentication import authenticate
 from tests.helpers.assertation_checker import (
     negative_result_assertation_checker,
 )
-from tests.helpers.helpers_for_media_adding import make_media_content
+from tests.helpers.case_types import ParamCases
 from tests.helpers.values import (
     MEDIAS_ROUTE,
-    ROUTE_TO_DELETE_TWEET,
-    ROUTE_TO_LIKE_SPECIFIED_TWEET,
-    SPECIFIED_USER_INFO_ROUTE,
-    SUBSCRIPTION_ROUTE,
-    TIMEOUT,
+    ROUTE_TO_SUBSCRIBE_SECOND_USER,
+    ROUTE_TO_USER_INFO,
     TWEET_DATA_FIELD,
+    TWEET_ID,
     TWEETS_ROUTE,
-    USER_ID,
     USER_INFO_ROUTE,
     VALUE_OF_TWEET_DATA_FIELD,
+    make_like_route,
+    make_tweet_route,
     wrong_header,
 )
 
-test_data_for_get_routes: List[str] = [
-    SPECIFIED_USER_INFO_ROUTE.format(USER_ID),
-    USER_INFO_ROUTE,
-    TWEETS_ROUTE,
-]
-
-test_data_for_post_routes: List[str] = [
-    TWEETS_ROUTE,
-    MEDIAS_ROUTE,
-    ROUTE_TO_LIKE_SPECIFIED_TWEET,
-    SUBSCRIPTION_ROUTE,
-]
-
-test_data_for_delete_routes: List[str] = [
-    ROUTE_TO_DELETE_TWEET,
-    SUBSCRIPTION_ROUTE,
-    ROUTE_TO_LIKE_SPECIFIED_TWEET,
-]
+pytestmark = pytest.mark.readonly
 
+test_data_for_authenticated_routes: ParamCases = (
+    pytest.param(ROUTE_TO_USER_INFO, id="user-info"),
+    pytest.param(USER_INFO_ROUTE, id="me"),
+    pytest.param(TWEETS_ROUTE, id="tweets"),
+    pytest.param(MEDIAS_ROUTE, id="medias"),
+    pytest.param(make_like_route(TWEET_ID), id="likes"),
+    pytest.param(ROUTE_TO_SUBSCRIBE_SECOND_USER, id="follow"),
+    pytest.param(make_tweet_route(TWEET_ID), id="tweet"),
+)
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("route", test_data_for_get_routes)
-async def test_cannot_get_data_without_api_key(
-    take_async_client,
-    route: str,
-) -> None:
-    """
-    Verify that data cannot be retrieved without an API key.
+test_data_for_api_keys: ParamCases = (
+    pytest.param(None, id="without-api-key"),
+    pytest.param(wrong_header["api-key"], id="with-wrong-api-key"),
+)
 
-    Args:
-        take_async_client (fixture):
-            Fixture that provides a simulation of an asynchronous client.
-        route (str):
-            The route being tested.
+TWEET_BODY: bytes = orjson.dumps(
+    {TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD},
+)
+wrong_json_header: Headers = Headers(
+    {**wrong_header, "content-type": "application/json"},
+)
 
-    Return:
-        Nothing.
-        If the test passes, it means that the application correctly denies
-        unauthenticated requests.
-    """
-    response = await take_async_client.get(url=route, timeout=TIMEOUT)
-    negative_result_assertation_checker(
-        response=response,
-        error_type="internal server error",
-    )
+test_data_for_denied_requests: ParamCases = (
+    pytest.param(
+        "GET",
+        USER_INFO_ROUTE,
+        None,
+        None,
+        id="GET-without-api-key",
+    ),
+    pytest.param(
+        "GET",
+        ROUTE_TO_USER_INFO,
+        wrong_header,
+        None,
+        id="GET-with-wrong-api-key",
+    ),
+    pytest.param(
+        "POST",
+        make_like_route(TWEET_ID),
+        None,
+        None,
+        id="POST-without-api-key",
+    ),
+    pytest.param(
+        "POST",
+        TWEETS_ROUTE,
+        wrong_json_header,
+        TWEET_BODY,
+        id="POST-with-wrong-api-key",
+    ),
+    pytest.param(
+        "DELETE",
+        ROUTE_TO_SUBSCRIBE_SECOND_USER,
+        None,
+        None,
+        id="DELETE-without-api-key",
+    ),
+    pytest.param(
+        "DELETE",
+        make_tweet_route(TWEET_ID),
+        wrong_header,
+        None,
+        id="DELETE-with-wrong-api-key",
+    ),
+)
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("route", test_data_for_get_routes)
-async def test_cannot_get_data_with_wrong_api_key(
-    take_async_client,
+@pytest.mark.auth_smoke
+@pytest.mark.parametrize("api_key", test_data_for_api_keys)
+@pytest.mark.parametrize("route", test_data_for_authenticated_routes)
+async def test_rejects_invalid_api_key(
+    verified_auth_routes: Optional[Set[str]],
     route: str,
+    api_key: Optional[str],
 ) -> None:
     """
-    Verify that data cannot be retrieved with a wrong API key.
-
-    Args:
-        take_async_client (fixture):
-            Fixture that provides a simulation of an asynchronous client.
-        route (str):
-            The route being tested.
-
-    Return:
-        Nothing.
-        If the test passes, it means that the application correctly denies
-        requests with wrong API keys.
-    """
-    response = await take_async_client.get(
-        url=route,
-        timeout=TIMEOUT,
-        headers=wrong_header,
-    )
-    negative_result_assertation_checker(
-        response=response,
-        error_type="internal server error",
-    )
+    Verify that the requests without a valid API key are not authenticated.
 
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize("route", test_data_for_post_routes)
-async def test_cannot_add_data_without_api_key(
-    take_async_client,
-    route: str,
-) -> None:
-    """
-    Verify that data cannot be added without an API key.
+    With the `--fast-auth` option the route already rejected with another
+    API key is skipped.
 
     Args:
-        take_async_client (fixture):
-            Fixture that provides a simulation of an asynchronous client.
+        verified_auth_routes (Optional[Set[str]]):
+            The routes already rejected or None to check each API key.
         route (str):
             The route being tested.
-
-    Return:
-        Nothing.
-        If the test passes, it means that the application correctly denies
-        unauthenticated requests.
+        api_key (Optional[str]):
+            The wrong API key or None.
     """
-    if route == TWEETS_ROUTE:
-        response = await take_async_client.post(
-            url=route,
-            timeout=TIMEOUT,
-            json=({TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD}),
-        )
-    else:
-        response = await take_async_client.post(
-            url=route,
-            timeout=TIMEOUT,
-            files=await make_media_content(),
-        )
-    negative_result_assertation_checker(
-        response=response,
-        error_type="internal server error",
-    )
+    if verified_auth_routes is not None and route in verified_auth_routes:
+        pytest.skip("The rejection of the route is already verified")
+    with pytest.raises(HTTPException):
+        await authenticate(path=route, api_key=api_key)
+    if verified_auth_routes is not None:
+        verified_auth_routes.add(route)
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("route", test_data_for_post_routes)
-async def test_cannot_add_data_with_wrong_api_key(
+@pytest.mark.parametrize(
+    "method,route,headers,request_body",
+    test_data_for_denied_requests,
+)
+async def test_cannot_access_data_without_valid_api_key(
     take_async_client,
+    method: str,
     route: str,
+    headers: Optional[Headers],
+    request_body: Optional[bytes],
 ) -> None:
     """
-    Verify that data cannot be added with a wrong API key.
-
-    Args:
-        take_async_client (fixture):
-            Fixture that provides a simulation of an asynchronous client.
-        route (str):
-            The route being tested.
-
-    Return:
-        Nothing.
-        If the test passes, it means that the application correctly denies
-        requests with wrong API keys.
-    """
-    if route == TWEETS_ROUTE:
-        response = await take_async_client.post(
-            url=route,
-            timeout=TIMEOUT,
-            headers=wrong_header,
-            json=({TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD}),
-        )
-    else:
-        response = await take_async_client.post(
-            url=route,
-            timeout=TIMEOUT,
-            headers=wrong_header,
-            files=await make_media_content(),
-        )
-    negative_result_assertation_checker(
-        response=response,
-        error_type="internal server error",
-    )
+    Verify that data cannot be accessed without a valid API key.
 
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize("route", test_data_for_delete_routes)
-async def test_cannot_delete_data_without_api_key(
-    take_async_client,
-    route: str,
-) -> None:
-    """
-    Verify that data cannot be deleted without an API key.
+    The requests of each HTTP method with the missing and with the wrong
+    API key check the error response sent by the application when
+    the authentication fails. The body of the
+    request is serialized in advance.
 
     Args:
         take_async_client (fixture):
             Fixture that provides a simulation of an asynchronous client.
+        method (str):
+            The HTTP method of the request.
         route (str):
             The route being tested.
+        headers (Optional[Headers]):
+            The headers with the wrong API key or None.
+        request_body (Optional[bytes]):
+            The serialized body of the request or None.
 
     Return:
         Nothing.
         If the test passes, it means that the application correctly denies
-        unauthenticated requests.
+        requests without a valid API key.
     """
-    if route == TWEETS_ROUTE:
-        response = await take_async_client.post(
-            url=route,
-            timeout=TIMEOUT,
-            json=({TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD}),
-        )
-    else:
-        response = await take_async_client.post(
-            url=route,
-            timeout=TIMEOUT,
-            files=await make_media_content(),
-        )
-    negative_result_assertation_checker(
-        response=response,
-        error_type="internal server error",
+    response = await take_async_client.request(
+        method=method,
+        url=route,
+        headers=headers,
+        content=request_body,
     )
-
-
-@pytest.mark.asyncio
-@pytest.mark.parametrize("route", test_data_for_delete_routes)
-async def test_cannot_delete_data_with_wrong_api_key(
-    take_async_client,
-    route: str,
-) -> None:
-    """
-    Verify that data cannot be deleted with a wrong API key.
-
-    Args:
-        take_async_client (fixture):
-            Fixture that provides a simulation of an asynchronous client.
-        route (str):
-            The route being tested.
-
-    Return:
-        Nothing.
-        If the test passes, it means that the application correctly denies
-        requests with wrong API keys.
-    """
-    if route == TWEETS_ROUTE:
-        response = await take_async_client.post(
-            url=route,
-            timeout=TIMEOUT,
-            headers=wrong_header,
-            json=({TWEET_DATA_FIELD: VALUE_OF_TWEET_DATA_FIELD}),
-        )
-    else:
-        response = await take_async_client.post(
-            url=route,
-            timeout=TIMEOUT,
-            headers=wrong_header,
-            files=await make_media_content(),
-        )
     negative_result_assertation_checker(
         response=response,
         error_type="internal server error",